@@ -0,0 +1,143 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import plotly.io as pio
+import streamlit as st
+
+from charts.figure_cache import figure_cache
+
+EXPORT_FORMATS = {
+    "PNG": ("png", "image/png"),
+    "SVG": ("svg", "image/svg+xml"),
+    "PDF": ("pdf", "application/pdf"),
+}
+
+EXPORT_SCALE = 3
+
+EXPORT_CACHE_SIZE = 32
+
+EXPORT_WORKERS = 2
+
+EXPORT_POLL_SECONDS = 1
+
+
+class ExportCache:
+    """LRU terbatas berisi Future hasil render, dikunci hash spesifikasi figure."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            future = self._items.get(key)
+            if future is not None:
+                self._items.move_to_end(key)
+            return future
+
+    def get_or_submit(self, key: str, submit) -> Future:
+        with self._lock:
+            future = self._items.get(key)
+            if future is None or (future.done() and future.exception()):
+                future = submit()
+                self._items[key] = future
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+            return future
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=EXPORT_WORKERS, thread_name_prefix="chart-export"
+)
+_cache = ExportCache(EXPORT_CACHE_SIZE)
+
+
+def export_key(source: str, fmt: str, scale: float) -> str:
+    raw = f"{fmt}:{scale}:{source}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def figure_source(fig) -> str:
+    """Identitas isi figure: kunci figure_cache (hash frame sumber) bila ada.
+
+    Hanya figure di luar cache yang perlu diserialisasi ke JSON.
+    """
+    source = figure_cache.key_for(fig)
+    return repr(source) if source is not None else fig.to_json()
+
+
+def render_figure(fig_json: str, fmt: str, scale: float) -> bytes:
+    return pio.from_json(fig_json).to_image(format=fmt, scale=scale)
+
+
+def export_button(fig, label: str, file_name: str, enabled: bool = True):
+    stem = file_name.rsplit(".", 1)[0]
+
+    if not enabled:
+        # Di Mode Live figure berubah setiap beberapa detik, jadi hasil
+        # render tidak akan pernah sempat diunduh.
+        st.caption("🖼️ Export gambar dinonaktifkan selama Mode Live.")
+        return
+
+    e1, e2 = st.columns([1, 3])
+
+    with e1:
+        fmt_label = st.selectbox(
+            "Format:",
+            list(EXPORT_FORMATS),
+            key=f"export_{stem}_format",
+            label_visibility="collapsed",
+        )
+
+    fmt, mime = EXPORT_FORMATS[fmt_label]
+    key = export_key(figure_source(fig), fmt, EXPORT_SCALE)
+    future = _cache.get(key)
+
+    with e2:
+        if future is None:
+            # Render baru dimulai saat diminta, bukan di setiap rerun.
+            if st.button(f"🖼️ Siapkan {fmt_label}", key=f"export_{stem}_prepare"):
+                future = _cache.get_or_submit(
+                    key,
+                    lambda: _executor.submit(
+                        render_figure, fig.to_json(), fmt, EXPORT_SCALE
+                    ),
+                )
+
+        if future is not None:
+            polling = not future.done()
+            run_every = EXPORT_POLL_SECONDS if polling else None
+            st.fragment(run_every=run_every)(_export_status)(
+                future, label, f"{stem}.{fmt}", mime, polling
+            )
+
+
+def _export_status(
+    future: Future, label: str, file_name: str, mime: str, polling: bool
+):
+    if not future.done():
+        st.caption("⏳ Sedang merender gambar...")
+        return
+
+    if polling:
+        # Render selesai saat polling: rerun sekali agar fragment dibuat
+        # ulang tanpa run_every.
+        st.rerun()
+
+    if future.exception() is not None:
+        st.error(f"Gagal merender gambar: {future.exception()}")
+        return
+
+    st.download_button(
+        label,
+        data=future.result(),
+        file_name=file_name,
+        mime=mime,
+        key=f"export_{file_name}_download",
+    )
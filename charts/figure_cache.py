@@ -0,0 +1,102 @@
+import functools
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from utils.columnar_cache import frame_hash
+
+FIGURE_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class FigureCache:
+    """Cache objek figure Plotly dengan eviksi berdasarkan ukuran JSON-nya.
+
+    Disimpan di level proses, sehingga semua sesi penonton dashboard
+    memakai hasil yang sama. Objek disimpan apa adanya: `pio.from_json`
+    di setiap hit memakan ~13–23 ms, sekitar 10% dari membangun ulang
+    figure (~170–200 ms untuk chart latency dan training curve).
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._keys = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._items.move_to_end(key)
+            return item[0]
+
+    def put(self, key, fig, size: int):
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._discard(self._items.pop(key, None))
+
+            self._items[key] = (fig, size)
+            self._keys[id(fig)] = key
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._discard(evicted)
+
+    def key_for(self, fig):
+        """Kunci cache untuk figure yang sedang tersimpan, atau None."""
+        with self._lock:
+            return self._keys.get(id(fig))
+
+    def _discard(self, item):
+        if item is None:
+            return
+        self._keys.pop(id(item[0]), None)
+        self._bytes -= item[1]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._items),
+                "bytes": self._bytes,
+            }
+
+
+figure_cache = FigureCache(FIGURE_CACHE_BYTES)
+
+
+def memoize_figure(kind: str):
+    """Decorator untuk fungsi pembangun figure `fn(data, *options)`.
+
+    Kunci cache adalah (jenis chart, hash isi frame, opsi). Objek Figure
+    dipakai bersama oleh semua pemanggil, jadi jangan diubah setelah
+    dikembalikan.
+    """
+
+    def decorator(build):
+        @functools.wraps(build)
+        def wrapper(data: pd.DataFrame, *options):
+            key = (kind, frame_hash(data), repr(options))
+
+            fig = figure_cache.get(key)
+            if fig is None:
+                fig = build(data, *options)
+                figure_cache.put(key, fig, len(fig.to_json()))
+
+            return fig
+
+        return wrapper
+
+    return decorator
@@ -1,11 +1,22 @@
-import io
-
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from charts.chart_export import export_button
+from charts.figure_cache import memoize_figure
+from utils.downsample import downsample_per_model
+from utils.metric_cube import MetricCube
 
-def map_comparison_chart(data: pd.DataFrame):
+TRAINING_CURVE_WIDTH = 1800
+
+# Total titik semua kurva; dibagi rata ke model yang tampil
+DOWNSAMPLE_POINTS_PER_PX = 0.1
+
+DOWNSAMPLE_MIN_POINTS = 40
+
+
+@memoize_figure("map_comparison")
+def map_comparison_figure(data: pd.DataFrame):
     fig = px.bar(
         data,
         x="Model",
@@ -55,20 +66,19 @@ def map_comparison_chart(data: pd.DataFrame):
         ),
     )
 
+    return fig
+
+
+def map_comparison_chart(data: pd.DataFrame):
+    fig = map_comparison_figure(data)
+
     st.plotly_chart(fig, width="stretch")
 
-    buf = io.BytesIO()
-    fig.write_image(buf, format="png", scale=3)
-    buf.seek(0)
-    st.download_button(
-        "📥 Download mAP Accuracy Charts",
-        data=buf.getvalue(),
-        file_name="map_accuracy.png",
-        mime="image/png",
-    )
+    export_button(fig, "📥 Download mAP Accuracy Charts", "map_accuracy.png")
 
 
-def latency_stacked_chart(data: pd.DataFrame):
+@memoize_figure("latency_stacked")
+def latency_stacked_figure(data: pd.DataFrame):
     metrics_order = ["Preprocessing (ms)", "Inference (ms)", "Postprocessing (ms)"]
     data["Metrics"] = pd.Categorical(
         data["Metrics"], categories=metrics_order, ordered=True
@@ -88,6 +98,20 @@ def latency_stacked_chart(data: pd.DataFrame):
         category_orders={"Metrics": metrics_order},
     )
 
+    # Error bar p50–p99 per tahap jika data distribusi latensi tersedia
+    if "p50" in data and "p99" in data:
+        for trace in fig.data:
+            stage = data[data["Metrics"] == trace.name]
+            trace.error_y = dict(
+                type="data",
+                symmetric=False,
+                array=(stage["p99"] - stage["Score"]).clip(lower=0),
+                arrayminus=(stage["Score"] - stage["p50"]).clip(lower=0),
+                thickness=2,
+                width=6,
+            )
+            trace.customdata = stage[["p50", "p99"]].to_numpy()
+
     fig.update_layout(
         xaxis_title="Model YOLO",
         yaxis_title="Waktu Latency (ms)",
@@ -120,49 +144,149 @@ def latency_stacked_chart(data: pd.DataFrame):
         title_font=dict(size=22),
     )
 
+    hovertemplate = (
+        "<b>Model:</b> %{x}<br>"
+        "<b>Metrics:</b> %{fullData.name}<br>"
+        "<b>Waktu:</b> %{y:.2f} ms"
+    )
+    if "p50" in data and "p99" in data:
+        hovertemplate += (
+            "<br><b>p50 / p99:</b> %{customdata[0]:.2f} / %{customdata[1]:.2f} ms"
+        )
+
     fig.update_traces(
         texttemplate="%{y:.2f}",
         textposition="auto",
         textfont=dict(size=22),
+        hovertemplate=hovertemplate + "<extra></extra>",
+    )
+
+    return fig
+
+
+def latency_stacked_chart(data: pd.DataFrame):
+    fig = latency_stacked_figure(data)
+
+    st.plotly_chart(fig, width="stretch")
+
+    export_button(fig, "📥 Download Model Eficiency Charts", "model_efficiency.png")
+
+
+@memoize_figure("scaling_curve")
+def scaling_curve_figure(data: pd.DataFrame, parameter: str, metric: str):
+    ordered_models = list(data["Model"].cat.remove_unused_categories().cat.categories)
+
+    fig = px.line(
+        data,
+        x=parameter,
+        y=metric,
+        color="Model",
+        markers=True,
+        category_orders={"Model": ordered_models},
+        color_discrete_sequence=px.colors.qualitative.Light24,
+        custom_data=["Scaling Efficiency"],
+    )
+
+    fig.update_traces(
+        line=dict(width=3),
+        marker=dict(size=10),
         hovertemplate=(
-            "<b>Model:</b> %{x}<br>"
-            "<b>Metrics:</b> %{fullData.name}<br>"
-            "<b>Waktu:</b> %{y:.2f} ms<extra></extra>"
+            "<b>Model:</b> %{fullData.name}<br>"
+            f"<b>{parameter}:</b> " + "%{x}<br>"
+            f"<b>{metric}:</b> " + "%{y:.2f}<br>"
+            "<b>Efisiensi Scaling:</b> %{customdata[0]:.0%}<extra></extra>"
         ),
     )
 
-    st.plotly_chart(fig, width="stretch")
+    knees = data[data["Knee"]]
+    fig.add_scatter(
+        x=knees[parameter],
+        y=knees[metric],
+        mode="markers",
+        name="Knee",
+        marker=dict(symbol="star", size=24, color="#333333"),
+        customdata=knees[["Model"]].astype(str),
+        hovertemplate=(
+            "<b>Knee:</b> %{customdata[0]}<br>"
+            f"<b>{parameter}:</b> " + "%{x}<extra></extra>"
+        ),
+    )
 
-    buf = io.BytesIO()
-    fig.write_image(buf, format="png", scale=3)
-    buf.seek(0)
-    st.download_button(
-        "📥 Download Model Eficiency Charts",
-        data=buf.getvalue(),
-        file_name="model_efficiency.png",
-        mime="image/png",
+    if metric == "Scaling Efficiency":
+        fig.add_hline(y=1.0, line_dash="dash", line_color="#999999")
+        fig.update_yaxes(tickformat=".0%")
+
+    fig.update_layout(
+        xaxis_title=parameter,
+        yaxis_title=metric,
+        font=dict(size=22),
+        legend=dict(font=dict(size=22)),
+        hoverlabel=dict(
+            font_size=22,
+            font_family="Arial",
+        ),
+        width=1800,
+        height=900,
+        margin=dict(l=120, r=80, t=80, b=120),
     )
 
+    # Batch size dan thread biasanya naik kelipatan dua
+    values = sorted(data[parameter].unique())
+    fig.update_xaxes(
+        type="log" if parameter != "Image Size" else "linear",
+        tickvals=values,
+        ticktext=[str(value) for value in values],
+        tickfont=dict(size=22),
+        title_font=dict(size=22),
+    )
+
+    fig.update_yaxes(
+        tickfont=dict(size=22),
+        title_font=dict(size=22),
+    )
+
+    return fig
+
+
+def scaling_curve_chart(data: pd.DataFrame, parameter: str, metric: str):
+    fig = scaling_curve_figure(data, parameter, metric)
+
+    st.plotly_chart(fig, width="stretch")
+
+    slug = parameter.lower().replace(" ", "_")
+    export_button(fig, "📥 Download Scaling Chart", f"scaling_{slug}.png")
+
+
+@memoize_figure("tradeoff_scatter")
+def tradeoff_scatter_figure(
+    overall_data: pd.DataFrame,
+    latency_col: str = "Total Time (ms)",
+    size_col: str = "Parameters (M)",
+):
+    latency_label = latency_col.replace("Total Time", "Total Latency")
+    latency_label = latency_label.removesuffix(" (ms)")
+
+    # Plotly menolak ukuran NaN; model yang belum diprofil tetap
+    # ditampilkan dengan marker ukuran minimum, tapi hover memakai nilai
+    # aslinya (kosong), bukan 0
+    missing_size = overall_data[size_col].isna().any()
+    overall_data = overall_data.assign(
+        marker_size=overall_data[size_col].fillna(0)
+    )
 
-def tradeoff_scatter_chart(overall_data: pd.DataFrame):
     fig = px.scatter(
         overall_data,
-        x="Total Time (ms)",
+        x=latency_col,
         y="mAP50-95",
-        size="Parameters (M)",
+        size="marker_size",
         color="Model",
         color_discrete_sequence=px.colors.qualitative.Light24,
-        hover_data={
-            "Model": True,
-            "Total Time (ms)": True,
-            "mAP50-95": True,
-            "Parameters (M)": True,
-        },
+        custom_data=["Model", size_col],
         size_max=50,
     )
 
     fig.update_layout(
-        xaxis=dict(title="Total Time (ms)"),
+        xaxis=dict(title=latency_col),
         yaxis=dict(title="mAP50-95"),
         font=dict(size=22),
         legend_title_text="Model",
@@ -193,26 +317,34 @@ def tradeoff_scatter_chart(overall_data: pd.DataFrame):
         textfont=dict(size=22),
         hovertemplate=(
             "<b>Model:</b> %{customdata[0]}<br>"
-            "<b>Total Latency:</b> %{x:.2f} ms<br>"
+            f"<b>{latency_label}:</b> %{{x:.2f}} ms<br>"
             "<b>mAP50-95:</b> %{y:.3f}<br>"
-            "<b>Parameters:</b> %{marker.size:.2f} M<extra></extra>"
+            f"<b>{size_col}:</b> " + "%{customdata[1]:.2f}<extra></extra>"
         ),
     )
 
+    if missing_size:
+        fig.update_traces(marker=dict(sizemin=6))
+
+    return fig
+
+
+def tradeoff_scatter_chart(
+    overall_data: pd.DataFrame,
+    latency_col: str = "Total Time (ms)",
+    size_col: str = "Parameters (M)",
+):
+    fig = tradeoff_scatter_figure(overall_data, latency_col, size_col)
+
     st.plotly_chart(fig, width="stretch")
 
-    buf = io.BytesIO()
-    fig.write_image(buf, format="png", scale=3)
-    buf.seek(0)
-    st.download_button(
-        "📥 Download Model Trade Off Scatter Plot",
-        data=buf.getvalue(),
-        file_name="scatter_trade-off.png",
-        mime="image/png",
+    export_button(
+        fig, "📥 Download Model Trade Off Scatter Plot", "scatter_trade-off.png"
     )
 
 
-def training_time_chart(overall_data: pd.DataFrame):
+@memoize_figure("training_time")
+def training_time_figure(overall_data: pd.DataFrame):
     fig = px.bar(
         overall_data,
         x="Model",
@@ -241,47 +373,17 @@ def training_time_chart(overall_data: pd.DataFrame):
         ),
     )
 
-    st.plotly_chart(fig, width="stretch")
-
+    return fig
 
-def robustness_heatmap(class_data: pd.DataFrame, metric: str):
-    model_order = {
-        1: "YOLOv8n",
-        2: "YOLOv8s",
-        3: "YOLOv8m",
-        4: "YOLOv8l",
-        5: "YOLOv9t",
-        6: "YOLOv9s",
-        7: "YOLOv9m",
-        8: "YOLOv9c",
-        9: "YOLOv10n",
-        10: "YOLOv10s",
-        11: "YOLOv10m",
-        12: "YOLOv10l",
-        13: "YOLOv11n",
-        14: "YOLOv11s",
-        15: "YOLOv11m",
-        16: "YOLOv11l",
-        17: "YOLOv12n",
-        18: "YOLOv12s",
-        19: "YOLOv12m",
-        20: "YOLOv12l",
-    }
-
-    model_list = list(model_order.values())
 
-    if metric == "Default":
-        metric = "mAP50"
-
-    heatmap_data = class_data.pivot(index="Model", columns="Class", values=metric)
+def training_time_chart(overall_data: pd.DataFrame):
+    fig = training_time_figure(overall_data)
 
-    existing_models_sorted = []
-    for model in model_list:
-        if model in heatmap_data.index:
-            existing_models_sorted.append(model)
+    st.plotly_chart(fig, width="stretch")
 
-    heatmap_data = heatmap_data.reindex(existing_models_sorted)
 
+@memoize_figure("robustness_heatmap")
+def robustness_heatmap_figure(heatmap_data: pd.DataFrame, metric: str):
     fig = px.imshow(
         heatmap_data,
         labels=dict(x="Kelas Emosi", y="Model", color=metric),
@@ -293,7 +395,7 @@ def robustness_heatmap(class_data: pd.DataFrame, metric: str):
 
     fig.update_layout(
         width=2000,
-        height=70 * len(existing_models_sorted),
+        height=70 * len(heatmap_data),
         font=dict(size=22),
         margin=dict(l=180),
     )
@@ -301,33 +403,40 @@ def robustness_heatmap(class_data: pd.DataFrame, metric: str):
     fig.update_xaxes(tickfont=dict(size=22), title_font=dict(size=22))
     fig.update_yaxes(tickfont=dict(size=22), title_font=dict(size=22))
 
+    return fig
+
+
+def robustness_heatmap(cube: MetricCube, metric: str):
+    if metric == "Default":
+        metric = "mAP50"
+
+    # Model di cube sudah mengikuti urutan ModelCatalog.
+    fig = robustness_heatmap_figure(cube.frame(metric), metric)
+
     st.plotly_chart(fig, width="stretch")
 
 
-def training_curve(data: pd.DataFrame, metric):
-    model_order = {
-        1: "YOLOv8n",
-        2: "YOLOv8s",
-        3: "YOLOv8m",
-        4: "YOLOv8l",
-        5: "YOLOv9t",
-        6: "YOLOv9s",
-        7: "YOLOv9m",
-        8: "YOLOv9c",
-        9: "YOLOv10n",
-        10: "YOLOv10s",
-        11: "YOLOv10m",
-        12: "YOLOv10l",
-        13: "YOLOv11n",
-        14: "YOLOv11s",
-        15: "YOLOv11m",
-        16: "YOLOv11l",
-        17: "YOLOv12n",
-        18: "YOLOv12s",
-        19: "YOLOv12m",
-        20: "YOLOv12l",
-    }
-    
+def training_curve_points(n_models: int) -> int:
+    """Target titik LTTB per model untuk training curve mode WebGL.
+
+    Anggaran titik mengikuti lebar chart dan dibagi ke semua model, jadi
+    run 300 epoch pun sudah ditipiskan:
+
+    >>> [training_curve_points(n) < 300 for n in (1, 5, 20)]
+    [True, True, True]
+    """
+    total = int(TRAINING_CURVE_WIDTH * DOWNSAMPLE_POINTS_PER_PX)
+    return max(total // max(n_models, 1), DOWNSAMPLE_MIN_POINTS)
+
+
+@memoize_figure("training_curve")
+def training_curve_figure(data: pd.DataFrame, metric: str, webgl: bool):
+    render_mode = "svg"
+    if webgl:
+        target_points = training_curve_points(data["Model"].nunique())
+        data = downsample_per_model(data, "epoch", metric, target_points)
+        render_mode = "webgl"
+
     visible_models = sorted(data["Model"].str.lower().unique())
     
     colors = [
@@ -344,9 +453,9 @@ def training_curve(data: pd.DataFrame, metric):
         for i, model in enumerate(visible_models)
     }
 
-    ordered_models = []
-    for m in model_order.values():
-        ordered_models.append(m.lower())
+    ordered_models = list(
+        data["Model"].cat.remove_unused_categories().cat.categories
+    )
 
     fig = px.line(
         data,
@@ -356,6 +465,7 @@ def training_curve(data: pd.DataFrame, metric):
         markers=False,
         category_orders={"Model": ordered_models},
         color_discrete_map=dynamic_color_map,
+        render_mode=render_mode,
     )
 
     max_val = data[metric].max()
@@ -377,7 +487,7 @@ def training_curve(data: pd.DataFrame, metric):
             font_size=22,
             font_family="Arial",
         ),
-        width=1800,
+        width=TRAINING_CURVE_WIDTH,
         height=900,
         margin=dict(l=120, r=80, t=80, b=120),
         hovermode="x unified",
@@ -397,14 +507,19 @@ def training_curve(data: pd.DataFrame, metric):
         ),
     )
 
+    return fig
+
+
+def training_curve(
+    data: pd.DataFrame, metric, webgl: bool = False, exportable: bool = True
+):
+    fig = training_curve_figure(data[["Model", "epoch", metric]], metric, webgl)
+
     st.plotly_chart(fig, width="stretch")
 
-    buf = io.BytesIO()
-    fig.write_image(buf, format="png", scale=3)
-    buf.seek(0)
-    st.download_button(
-        "📥 Download Training Curve (High Resolution PNG)",
-        data=buf.getvalue(),
-        file_name="training_curve.png",
-        mime="image/png",
+    export_button(
+        fig,
+        "📥 Download Training Curve (High Resolution)",
+        "training_curve.png",
+        enabled=exportable,
     )
@@ -0,0 +1,231 @@
+import argparse
+import multiprocessing
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+import pandas as pd
+import streamlit as st
+
+from charts.chart_export import EXPORT_FORMATS, EXPORT_SCALE, render_figure
+from charts.yolo_charts import (
+    latency_stacked_figure,
+    map_comparison_figure,
+    robustness_heatmap_figure,
+    scaling_curve_figure,
+    tradeoff_scatter_figure,
+    training_curve_figure,
+    training_time_figure,
+)
+from reports.chart_page import (
+    latency_chart_data,
+    map_chart_data,
+    sweep_chart_data,
+    sweep_default_fixed,
+    training_time_data,
+)
+from reports.tabel_page import (
+    ACCURACY_COLUMNS,
+    class_map50_data,
+    efficiency_columns,
+)
+from table.yolo_tabel import (
+    accuracy_table_figure,
+    class_emotions_table_figure,
+    efficiency_table_figure,
+)
+from utils.load_data import (
+    DERIVED_COLUMNS,
+    SWEEP_PARAMETERS,
+    load_main_data,
+    load_metric_cube,
+    load_sweep_data,
+    load_training_logs,
+)
+from utils.model_catalog import VARIANT_GROUPS
+
+DATASETS = ["human-face-emotion-computer-vision-model", "fer-2013"]
+
+REPORT_TRAINING_METRIC = "metrics/mAP50-95(B)"
+
+REPORT_SWEEP_METRIC = "Throughput (FPS)"
+
+REPORT_WORKERS = 4
+
+
+def report_figures(dataset: str) -> dict:
+    overall_data, _ = load_main_data(dataset)
+    cube = load_metric_cube(dataset)
+
+    figures = {
+        "charts/map_accuracy": map_comparison_figure(
+            map_chart_data(overall_data).sort_values("Model")
+        ),
+        "charts/model_efficiency": latency_stacked_figure(
+            latency_chart_data(overall_data).sort_values("Model")
+        ),
+        "charts/scatter_trade-off": tradeoff_scatter_figure(overall_data),
+        "charts/training_time": training_time_figure(
+            training_time_data(overall_data).sort_values("Model")
+        ),
+        "tables/accuracy": accuracy_table_figure(overall_data[ACCURACY_COLUMNS]),
+        "tables/efficiency": efficiency_table_figure(
+            overall_data[efficiency_columns(overall_data)]
+        ),
+        "tables/class_map50": class_emotions_table_figure(
+            class_map50_data(dataset), dataset
+        ),
+    }
+
+    for metric in cube.metrics:
+        figures[f"charts/heatmap_{metric}"] = robustness_heatmap_figure(
+            cube.frame(metric), metric
+        )
+
+    sweep = load_sweep_data(dataset)
+    if sweep is not None:
+        for parameter in SWEEP_PARAMETERS:
+            fixed = sweep_default_fixed(sweep, parameter)
+            data = sweep_chart_data(sweep, parameter, fixed)
+            if data.empty:
+                continue
+
+            slug = parameter.lower().replace(" ", "_")
+            figures[f"charts/scaling_{slug}"] = scaling_curve_figure(
+                data, parameter, REPORT_SWEEP_METRIC
+            )
+
+    training_logs = load_training_logs(dataset)
+    if training_logs is not None and REPORT_TRAINING_METRIC in training_logs:
+        for variant in VARIANT_GROUPS:
+            data = training_logs[training_logs["variant"] == variant]
+            if data.empty:
+                continue
+
+            slug = variant.split(" (")[0].lower().replace(" & ", "-")
+            figures[f"charts/training_curve_{slug}"] = training_curve_figure(
+                data[["Model", "epoch", REPORT_TRAINING_METRIC]],
+                REPORT_TRAINING_METRIC,
+                False,
+            )
+
+    return figures
+
+
+def report_workbook(dataset: str) -> bytes:
+    overall_data, _ = load_main_data(dataset)
+
+    sheets = {
+        "Raw Data": overall_data.drop(columns=DERIVED_COLUMNS),
+        "Akurasi": overall_data[ACCURACY_COLUMNS],
+        "Efisiensi": overall_data[efficiency_columns(overall_data)].drop(
+            columns=DERIVED_COLUMNS, errors="ignore"
+        ),
+        "mAP50 per Kelas": class_map50_data(dataset),
+    }
+
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+        for name, data in sheets.items():
+            data.to_excel(writer, index=False, sheet_name=name)
+    return output.getvalue()
+
+
+def render_figures(figures: dict, fmt: str, workers: int) -> dict:
+    # Kaleido dijalankan di proses terpisah; "spawn" aman dipakai dari
+    # server Streamlit yang sudah punya banyak thread.
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {
+            name: pool.submit(render_figure, fig.to_json(), fmt, EXPORT_SCALE)
+            for name, fig in figures.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def build_report(datasets: list, fmt: str = "png", workers: int = None) -> bytes:
+    figures = {}
+    workbooks = {}
+
+    for dataset in datasets:
+        overall_data, all_class_data = load_main_data(dataset)
+        if overall_data is None or all_class_data is None:
+            raise FileNotFoundError(f"Data untuk dataset {dataset} tidak ditemukan")
+
+        for name, fig in report_figures(dataset).items():
+            figures[f"{dataset}/{name}.{fmt}"] = fig
+        workbooks[f"{dataset}/{dataset}_tables.xlsx"] = report_workbook(dataset)
+
+    workers = workers or min(REPORT_WORKERS, os.cpu_count() or 1, len(figures))
+    images = render_figures(figures, fmt, workers)
+
+    output = BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in {**workbooks, **images}.items():
+            archive.writestr(name, content)
+    return output.getvalue()
+
+
+def bulk_export_sidebar(dataset: str):
+    with st.sidebar.expander("📦 Export Laporan Lengkap"):
+        scope = st.radio(
+            "Dataset:",
+            ["Dataset aktif", "Semua dataset"],
+            key="bulk_export_scope",
+        )
+        fmt_label = st.selectbox(
+            "Format gambar:", list(EXPORT_FORMATS), key="bulk_export_format"
+        )
+
+        datasets = [dataset] if scope == "Dataset aktif" else DATASETS
+        fmt = EXPORT_FORMATS[fmt_label][0]
+        report_key = (tuple(datasets), fmt)
+
+        if st.button("Buat Laporan", key="bulk_export_build"):
+            with st.spinner("Merender semua chart dan tabel..."):
+                try:
+                    st.session_state["bulk_export_report"] = (
+                        report_key,
+                        build_report(datasets, fmt),
+                    )
+                except FileNotFoundError as err:
+                    st.error(str(err))
+
+        report = st.session_state.get("bulk_export_report")
+        if report is not None and report[0] == report_key:
+            st.download_button(
+                "📥 Download Laporan (ZIP)",
+                data=report[1],
+                file_name="yolo_comparison_report.zip",
+                mime="application/zip",
+                key="bulk_export_download",
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export semua chart dan tabel perbandingan YOLO ke satu ZIP."
+    )
+    parser.add_argument(
+        "--dataset",
+        action="append",
+        help="Dataset yang diekspor (boleh diulang, default: semua).",
+    )
+    parser.add_argument("--output", default="yolo_comparison_report.zip")
+    parser.add_argument(
+        "--format", default="png", choices=[v[0] for v in EXPORT_FORMATS.values()]
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    report = build_report(args.dataset or DATASETS, args.format, args.workers)
+
+    with open(args.output, "wb") as f:
+        f.write(report)
+    print(f"Laporan disimpan ke {args.output}")
+
+
+if __name__ == "__main__":
+    main()
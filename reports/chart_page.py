@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -5,6 +6,7 @@ from charts.yolo_charts import (
     latency_stacked_chart,
     map_comparison_chart,
     robustness_heatmap,
+    scaling_curve_chart,
     tradeoff_scatter_chart,
     training_curve,
     training_time_chart,
@@ -14,36 +16,152 @@ from utils.filter import (
     filter_and_sort_heatmap_data,
     filter_and_sort_training_data,
 )
-from utils.load_data import load_training_logs
-from utils.time_converter import hhmmss_to_minutes
+from utils.load_data import (
+    DERIVED_COLUMNS,
+    LATENCY_PERCENTILES,
+    SWEEP_METRICS,
+    SWEEP_PARAMETERS,
+    footprint_columns,
+    latency_column,
+    latency_columns,
+    load_metric_cube,
+    load_sweep_data,
+    load_training_logs,
+)
+from utils.log_watcher import get_training_log_tail
 
+LIVE_REFRESH_SECONDS = 2
 
-def chart_sections(overall_data: pd.DataFrame, class_data: pd.DataFrame, dataset: str):
-    st.subheader("Chart Perbandingan Akurasi Arsitekur Model YOLO: mAP50 & mAP50-95")
-    mAP_data = overall_data.melt(
+LATENCY_CHART_STAGES = ["Preprocessing", "Inference", "Postprocessing"]
+
+# Jarak minimum (skala ternormalisasi) dari garis lurus agar titik dianggap knee
+SWEEP_KNEE_MIN_DISTANCE = 0.1
+
+
+def map_chart_data(overall_data: pd.DataFrame) -> pd.DataFrame:
+    return overall_data.melt(
         id_vars=["Model"],
         value_vars=["mAP50", "mAP50-95"],
         var_name="Metrics",
         value_name="Score",
     )
 
+
+def latency_chart_data(overall_data: pd.DataFrame) -> pd.DataFrame:
+    data = overall_data.melt(
+        id_vars="Model",
+        value_vars=[f"{stage} (ms)" for stage in LATENCY_CHART_STAGES],
+        var_name="Metrics",
+        value_name="Score",
+    )
+
+    # Rentang p50–p99 per tahap untuk error bar, jika tersedia
+    for statistic in ["p50", "p99"]:
+        columns = [latency_column(stage, statistic) for stage in LATENCY_CHART_STAGES]
+        if all(col in overall_data for col in columns):
+            # Urutan melt: semua model untuk tahap pertama, lalu tahap berikutnya
+            data[statistic] = overall_data[columns].to_numpy().ravel(order="F")
+
+    return data
+
+
+def knee_index(x: np.ndarray, y: np.ndarray):
+    """Posisi knee kurva: titik terjauh dari garis antara titik awal dan akhir.
+
+    Sumbu x memakai skala log2 karena nilai sweep naik berlipat. Kurva yang
+    hampir lurus tidak punya knee.
+    """
+    if len(x) < 3 or y[-1] == y[0]:
+        return None
+
+    log_x = np.log2(x)
+    x_norm = (log_x - log_x[0]) / (log_x[-1] - log_x[0])
+    y_norm = (y - y[0]) / (y[-1] - y[0])
+
+    distance = np.abs(y_norm - x_norm)
+    index = int(np.argmax(distance[1:-1])) + 1
+
+    return index if distance[index] >= SWEEP_KNEE_MIN_DISTANCE else None
+
+
+def sweep_default_fixed(sweep: pd.DataFrame, parameter: str) -> dict:
+    """Nilai paling sering untuk setiap parameter selain `parameter`.
+
+    Pada sweep satu-per-satu, nilai ini adalah konfigurasi dasarnya.
+    """
+    return {
+        param: sweep[param].value_counts().idxmax()
+        for param in SWEEP_PARAMETERS
+        if param != parameter and not sweep.empty
+    }
+
+
+def sweep_chart_data(sweep: pd.DataFrame, parameter: str, fixed: dict):
+    """Kurva satu parameter sweep per model, dengan efisiensi scaling dan knee.
+
+    Efisiensi scaling membandingkan kenaikan throughput terhadap titik
+    pertama dengan kenaikan ideal: linear terhadap batch size dan thread,
+    dan berbanding terbalik dengan jumlah piksel untuk image size.
+    """
+    mask = np.ones(len(sweep), dtype=bool)
+    for param, value in fixed.items():
+        mask &= sweep[param].to_numpy() == value
+
+    data = sweep[mask].sort_values(["Model", parameter]).reset_index(drop=True)
+    data["Model"] = data["Model"].cat.remove_unused_categories()
+    data["Scaling Efficiency"] = np.nan
+    data["Knee"] = False
+
+    for _, rows in data.groupby("Model", observed=True).groups.items():
+        x = data.loc[rows, parameter].to_numpy(dtype=float)
+        throughput = data.loc[rows, "Throughput (FPS)"].to_numpy()
+
+        if parameter == "Image Size":
+            ideal = (x[0] / x) ** 2
+        else:
+            ideal = x / x[0]
+        data.loc[rows, "Scaling Efficiency"] = throughput / throughput[0] / ideal
+
+        knee = knee_index(x, throughput)
+        if knee is not None:
+            data.loc[rows[knee], "Knee"] = True
+
+    return data
+
+
+def training_time_data(overall_data: pd.DataFrame) -> pd.DataFrame:
+    training_data = overall_data.copy()
+    training_data["Training Time (menit)"] = overall_data["training_seconds"] / 60
+    return training_data
+
+
+def chart_sections(overall_data: pd.DataFrame, dataset: str):
+    st.subheader("Chart Perbandingan Akurasi Arsitekur Model YOLO: mAP50 & mAP50-95")
+    mAP_data = map_chart_data(overall_data)
+
     mAP_data = chart_filter_options(mAP_data, "mAP")
     map_comparison_chart(mAP_data)
 
     st.divider()
 
     st.subheader("Chart Perbandingan Latency Arsitekur Model YOLO")
-    latency_data = overall_data.melt(
-        id_vars="Model",
-        value_vars=["Preprocessing (ms)", "Inference (ms)", "Postprocessing (ms)"],
-        var_name="Metrics",
-        value_name="Score",
-    )
+    latency_data = latency_chart_data(overall_data)
 
     latency_data = chart_filter_options(latency_data, "latency")
 
     latency_stacked_chart(latency_data)
 
+    if "p99" in latency_data and latency_data["p99"].notna().any():
+        st.caption(
+            "Error bar menunjukkan rentang p50–p99 setiap tahap; "
+            "tinggi batang adalah rata-rata."
+        )
+
+    st.divider()
+
+    st.subheader("Skalabilitas CPU: Batch Size, Image Size & Thread")
+    sweep_section(dataset)
+
     st.divider()
 
     st.subheader("Trade-off Kecepatan vs Akurasi (Scatter Plot)")
@@ -58,14 +176,35 @@ def chart_sections(overall_data: pd.DataFrame, class_data: pd.DataFrame, dataset
         if selected_models:
             overall_data = overall_data[overall_data["Model"].isin(selected_models)]
 
-    tradeoff_scatter_chart(overall_data)
+    with s2:
+        available = latency_columns(overall_data)
+        latency_options = {"Mean": "Total Time (ms)"}
+        for q in LATENCY_PERCENTILES:
+            col = latency_column("Total Time", f"p{q}")
+            if col in available:
+                latency_options[f"p{q}"] = col
+
+        latency_choice = st.selectbox(
+            "Latency sumbu X:",
+            list(latency_options),
+            key="scatter_latency",
+        )
 
-    st.divider()
-    training_data = overall_data.copy()
-    training_data["Training Time (menit)"] = overall_data["Training Time"].apply(
-        hhmmss_to_minutes
+    with s3:
+        # Ukuran marker: parameter model atau footprint runtime hasil profil
+        size_col = st.selectbox(
+            "Ukuran marker:",
+            ["Parameters (M)"] + footprint_columns(overall_data),
+            key="scatter_size",
+        )
+
+    tradeoff_scatter_chart(
+        overall_data, latency_options[latency_choice], size_col
     )
 
+    st.divider()
+    training_data = training_time_data(overall_data)
+
     st.subheader("Waktu Pelatihan Model YOLO (Menit)")
     training_data = filter_and_sort_training_data(training_data)
     training_time_chart(training_data)
@@ -73,20 +212,99 @@ def chart_sections(overall_data: pd.DataFrame, class_data: pd.DataFrame, dataset
     st.divider()
 
     st.subheader("Heat Map Ketangguhan (Robustness) Model YOLO")
-    class_data, metrics = filter_and_sort_heatmap_data(class_data)
-    robustness_heatmap(class_data, metrics)
+    cube, metrics = filter_and_sort_heatmap_data(load_metric_cube(dataset))
+    robustness_heatmap(cube, metrics)
 
     st.divider()
 
-    training_logs = load_training_logs(dataset)
+    live_mode = st.toggle(
+        "Mode Live (pantau log training yang masih berjalan)",
+        key="training_live_mode",
+    )
+
+    if live_mode:
+        st.fragment(run_every=LIVE_REFRESH_SECONDS)(training_curve_section)(
+            dataset, live_mode
+        )
+    else:
+        training_curve_section(dataset, live_mode)
+
+
+def sweep_section(dataset: str):
+    sweep = load_sweep_data(dataset)
+
+    if sweep is None:
+        st.info(
+            "Belum ada hasil sweep. Jalankan "
+            "`python -m reports.cpu_sweep --images <folder> --dataset "
+            f"{dataset}` untuk membuatnya."
+        )
+        return
+
+    w1, w2, w3 = st.columns(3)
+
+    with w1:
+        parameter = st.selectbox(
+            "Parameter Sweep:", SWEEP_PARAMETERS, key="sweep_parameter"
+        )
+
+    with w2:
+        metric = st.selectbox(
+            "Metrik:", SWEEP_METRICS + ["Scaling Efficiency"], key="sweep_metric"
+        )
+
+    with w3:
+        selected_models = st.multiselect(
+            "Pilih Model yang Ditampilkan:",
+            sweep["Model"].unique(),
+            key="sweep_models",
+        )
+
+        if selected_models:
+            sweep = sweep[sweep["Model"].isin(selected_models)]
+
+    fixed = {}
+    defaults = sweep_default_fixed(sweep, parameter)
+    others = [param for param in SWEEP_PARAMETERS if param != parameter]
+    for column, param in zip(st.columns(len(others)), others):
+        options = sorted(sweep[param].unique())
+
+        with column:
+            fixed[param] = st.selectbox(
+                f"{param} (tetap):",
+                options,
+                index=options.index(defaults[param]) if options else 0,
+                key=f"sweep_fixed_{param}",
+            )
+
+    data = sweep_chart_data(sweep, parameter, fixed)
+    if data.empty:
+        st.warning("Tidak ada hasil sweep untuk kombinasi ini.")
+        return
+
+    scaling_curve_chart(data, parameter, metric)
+
+    st.caption(
+        "Bintang menandai knee kurva throughput, yaitu titik setelah itu "
+        "kenaikan parameter tidak lagi sebanding dengan throughput. Efisiensi "
+        "scaling 100% berarti throughput naik sesuai ideal."
+    )
+
+
+def training_curve_section(dataset: str, live_mode: bool):
+    if live_mode:
+        tail = get_training_log_tail(dataset)
+        training_logs = tail.refresh() if tail is not None else None
+    else:
+        training_logs = load_training_logs(dataset)
+
     if training_logs is None:
         st.write("Error: no training logs data!")
         st.stop()
 
-    ignore_cols = [
+    ignore_cols = DERIVED_COLUMNS + [
         "epoch",
         "Model",
-        "Variant_Group",
         "time",
         "train/box_loss",
         "train/cls_loss",
@@ -146,7 +364,7 @@ def chart_sections(overall_data: pd.DataFrame, class_data: pd.DataFrame, dataset
             key="filter_mode",
         )
 
-    active_column = "Variant_Group"
+    active_column = "variant"
 
     with k2:
         if filter_mode == "Variant Group":
@@ -155,21 +373,17 @@ def chart_sections(overall_data: pd.DataFrame, class_data: pd.DataFrame, dataset
                 variant_options,
                 key="variant_group_filter",
             )
-            active_column = "Variant_Group"
+            active_column = "variant"
 
         elif filter_mode == "Model Family":
-            training_logs["Family"] = training_logs["Model"].str.extract(
-                r"(yolov\d+)", expand=False
-            )
-
-            family_options = sorted(training_logs["Family"].unique())
+            family_options = list(training_logs["family"].cat.categories)
 
             selected_filter = st.selectbox(
                 "Pilih Model Family:",
                 family_options,
                 key="family_filter",
             )
-            active_column = "Family"
+            active_column = "family"
 
         else:
             selected_filter = st.selectbox(
@@ -182,7 +396,7 @@ def chart_sections(overall_data: pd.DataFrame, class_data: pd.DataFrame, dataset
             "Pilih Metrik:", metric_options, key="metric_selection"
         )
 
-    filtered_data = training_logs.copy()
+    filtered_data = training_logs
 
     if filter_mode == "Most Optimal from each Family" and selected_filter == "All":
         if dataset == "human-face-emotion-computer-vision-model":
@@ -213,5 +427,34 @@ def chart_sections(overall_data: pd.DataFrame, class_data: pd.DataFrame, dataset
     else:
         filtered_data = training_logs[training_logs[active_column] == selected_filter]
 
+    r1, r2 = st.columns([1, 2])
+
+    with r1:
+        render_mode = st.selectbox(
+            "Mode Render:",
+            ["SVG (resolusi penuh)", "WebGL (downsampled)"],
+            key="training_render_mode",
+        )
+        webgl = render_mode == "WebGL (downsampled)"
+
+    with r2:
+        if webgl and not filtered_data.empty:
+            first_epoch = int(filtered_data["epoch"].min())
+            last_epoch = int(filtered_data["epoch"].max())
+
+            if first_epoch < last_epoch:
+                # Rentang yang lebih sempit di-downsample ulang, jadi zoom
+                # ke beberapa epoch kembali menampilkan resolusi penuh.
+                epoch_range = st.slider(
+                    "Rentang Epoch (zoom):",
+                    first_epoch,
+                    last_epoch,
+                    (first_epoch, last_epoch),
+                    key="training_epoch_range",
+                )
+                filtered_data = filtered_data[
+                    filtered_data["epoch"].between(*epoch_range)
+                ]
+
     st.subheader(f"Kurva Pelatihan untuk {selected_filter}")
-    training_curve(filtered_data, selected_metric)
+    training_curve(filtered_data, selected_metric, webgl, exportable=not live_mode)
@@ -0,0 +1,302 @@
+import argparse
+import json
+import os
+import platform
+import socket
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.frame_sources import ImageFolderSource
+from utils.latency_telemetry import BENCHMARK_STAGES, speed_timings
+from utils.load_data import (
+    BENCHMARK_RESULTS_FILE,
+    LATENCY_COLUMNS,
+    LATENCY_SAMPLES_FILE,
+    OVERALL_COLUMNS,
+    OVERALL_RESULTS_FILE,
+    latency_summary,
+    metadata_path,
+)
+from utils.model_backends import (
+    MODEL_BACKENDS,
+    MODELS_DIR,
+    checkpoint_hash,
+    checkpoint_size,
+    collect_frames,
+    load_backend_model,
+)
+from utils.model_catalog import checkpoint_model_name
+
+BENCHMARK_WARMUP = 10
+
+BENCHMARK_TRIALS = 3
+
+BENCHMARK_MAX_IMAGES = 200
+
+BENCHMARK_PACKAGES = [
+    "ultralytics",
+    "torch",
+    "onnxruntime",
+    "openvino",
+    "opencv-python",
+    "opencv-python-headless",
+    "numpy",
+]
+
+# Backend yang jumlah thread inferensinya benar-benar diatur pin_threads.
+# Ultralytics membuat sesi ONNX Runtime dan OpenVINO sendiri tanpa opsi
+# jumlah thread, jadi keduanya tetap memakai default runtime-nya.
+THREAD_PINNED_BACKENDS = ["PyTorch"]
+
+EFFICIENCY_COLUMNS = [
+    "Preprocessing (ms)",
+    "Inference (ms)",
+    "Postprocessing (ms)",
+    "Total Time (ms)",
+    "FPS",
+]
+
+
+def pin_threads(threads: int):
+    # Variabel lingkungan hanya berlaku untuk pustaka yang belum dimuat
+    # (numpy sudah dimuat saat ini); torch dan OpenCV diatur langsung
+    for name in ["OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"]:
+        os.environ[name] = str(threads)
+
+    import cv2
+    import torch
+
+    torch.set_num_threads(threads)
+    cv2.setNumThreads(threads)
+
+
+def cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def package_versions() -> dict:
+    versions = {}
+    for package in BENCHMARK_PACKAGES:
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            continue
+    return versions
+
+
+def run_metadata(args, images: int, checkpoints: dict) -> dict:
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "host": socket.gethostname(),
+        "cpu": cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "threads": args.threads,
+        "threads_pinned": args.backend in THREAD_PINNED_BACKENDS,
+        "backend": args.backend,
+        "warmup": args.warmup,
+        "trials": args.trials,
+        "images": images,
+        "image_dir": str(args.images),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "packages": package_versions(),
+        "checkpoints": checkpoints,
+    }
+
+
+def benchmark_checkpoint(model, frames: list, warmup: int, trials: int) -> dict:
+    """Waktu per tahap (ms) untuk setiap gambar di setiap trial, batch 1 di CPU."""
+    for frame in (frames * warmup)[:warmup]:
+        model(frame, device="cpu", verbose=False)
+
+    samples = {stage: [] for stage in BENCHMARK_STAGES}
+    for _ in range(trials):
+        for frame in frames:
+            result = model(frame, device="cpu", verbose=False)[0]
+            for stage, ms in speed_timings(result.speed).items():
+                samples[stage].append(ms)
+
+    return {stage: np.asarray(values) for stage, values in samples.items()}
+
+
+def efficiency_row(samples: dict) -> dict:
+    mean = {stage: float(values.mean()) for stage, values in samples.items()}
+    total = sum(mean.values())
+
+    row = {
+        "Preprocessing (ms)": mean["Preprocessing"],
+        "Inference (ms)": mean["Inference"],
+        "Postprocessing (ms)": mean["Postprocessing"],
+        "Total Time (ms)": total,
+        "FPS": 1000 / total if total else np.nan,
+    }
+    return {col: round(value, 4) for col, value in row.items()}
+
+
+def merge_results(base: pd.DataFrame, results: pd.DataFrame) -> pd.DataFrame:
+    """Ganti kolom efisiensi di `base` untuk model yang di-benchmark.
+
+    Model yang belum ada di `base` ditambahkan dengan kolom akurasi kosong.
+    Hasilnya selalu memakai urutan `OVERALL_COLUMNS` diikuti kolom
+    distribusi latensi.
+    """
+    if base is None:
+        merged = results.copy()
+    else:
+        merged = base.copy()
+        # Nama model dicocokkan tanpa membedakan huruf besar
+        rows = pd.Index(merged["Model"].str.lower()).get_indexer(
+            results["Model"].str.lower()
+        )
+
+        known = rows >= 0
+        for col in EFFICIENCY_COLUMNS + ["Size"] + LATENCY_COLUMNS:
+            merged.loc[merged.index[rows[known]], col] = results.loc[known, col].values
+
+        merged = pd.concat([merged, results[~known]], ignore_index=True)
+
+    merged["Index"] = np.arange(1, len(merged) + 1)
+    return merged.reindex(columns=OVERALL_COLUMNS + LATENCY_COLUMNS)
+
+
+def load_frames(image_dir, max_images: int) -> list:
+    frames = collect_frames(ImageFolderSource(image_dir), max_images)
+    if not frames:
+        raise FileNotFoundError(f"Tidak ada gambar di {image_dir}")
+    return frames
+
+
+def select_checkpoints(models: list = None) -> list:
+    """Checkpoint `.pt` di `MODELS_DIR`, opsional hanya nama model tertentu."""
+    checkpoints = sorted(MODELS_DIR.glob("*.pt"))
+    if models:
+        wanted = {name.lower() for name in models}
+        checkpoints = [
+            path
+            for path in checkpoints
+            if checkpoint_model_name(path.name).lower() in wanted
+        ]
+    if not checkpoints:
+        raise FileNotFoundError(f"Tidak ada checkpoint .pt di {MODELS_DIR}")
+    return checkpoints
+
+
+def run_benchmark(args) -> tuple:
+    pin_threads(args.threads)
+    if args.backend not in THREAD_PINNED_BACKENDS:
+        print(
+            f"Peringatan: --threads tidak diteruskan ke {args.backend}; "
+            "runtime memakai jumlah thread default-nya."
+        )
+
+    frames = load_frames(args.images, args.max_images)
+    checkpoints = select_checkpoints(args.model)
+
+    rows = []
+    timings = []
+    hashes = {}
+    for checkpoint in checkpoints:
+        model_name = checkpoint_model_name(checkpoint.name)
+        print(f"Benchmark {model_name} ({checkpoint.name})...")
+
+        model = load_backend_model(checkpoint.name, args.backend)
+        samples = benchmark_checkpoint(model, frames, args.warmup, args.trials)
+
+        rows.append(
+            {
+                "Model": model_name,
+                "Size": checkpoint_size(checkpoint),
+                **efficiency_row(samples),
+            }
+        )
+        timings.append(
+            pd.DataFrame(
+                {
+                    "Model": model_name,
+                    **{f"{stage} (ms)": values for stage, values in samples.items()},
+                }
+            )
+        )
+        hashes[checkpoint.name] = checkpoint_hash(checkpoint)
+
+    timings = pd.concat(timings, ignore_index=True)
+    results = pd.DataFrame(rows).merge(latency_summary(timings), on="Model")
+    metadata = run_metadata(args, len(frames), hashes)
+
+    return results, timings, metadata
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark latensi CPU semua checkpoint di models/ dan tulis hasilnya "
+            "dalam format Testing-Results CSV."
+        )
+    )
+    parser.add_argument("--images", required=True, help="Folder gambar uji.")
+    parser.add_argument(
+        "--dataset",
+        default="human-face-emotion-computer-vision-model",
+        help="Dataset yang kolom akurasinya dipertahankan.",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help=(
+            f"File CSV hasil (default: data/<dataset>/{BENCHMARK_RESULTS_FILE}, "
+            "dibaca dashboard selama lebih baru dari file asli)."
+        ),
+    )
+    parser.add_argument(
+        "--model",
+        action="append",
+        help="Hanya benchmark model ini (boleh diulang, misalnya YOLOv8n).",
+    )
+    parser.add_argument("--backend", default="PyTorch", choices=list(MODEL_BACKENDS))
+    parser.add_argument("--threads", type=int, default=os.cpu_count())
+    parser.add_argument("--warmup", type=int, default=BENCHMARK_WARMUP)
+    parser.add_argument("--trials", type=int, default=BENCHMARK_TRIALS)
+    parser.add_argument("--max-images", type=int, default=BENCHMARK_MAX_IMAGES)
+    parser.add_argument(
+        "--samples",
+        action="store_true",
+        help=f"Tulis juga waktu per gambar ke {LATENCY_SAMPLES_FILE} di folder output.",
+    )
+    args = parser.parse_args()
+
+    dataset_dir = Path("data") / args.dataset
+    base_path = dataset_dir / OVERALL_RESULTS_FILE
+    output = Path(args.output or dataset_dir / BENCHMARK_RESULTS_FILE)
+
+    results, timings, metadata = run_benchmark(args)
+
+    base = pd.read_csv(base_path) if base_path.exists() else None
+    merge_results(base, results).to_csv(output, index=False)
+
+    meta_path = metadata_path(output)
+    with open(meta_path, "w") as f:
+        json.dump(metadata, f, indent=2)
+
+    if args.samples:
+        # Metadata yang sama menandai sampel ini milik hasil di `output`
+        samples_path = output.with_name(LATENCY_SAMPLES_FILE)
+        timings.round(4).to_csv(samples_path, index=False)
+        with open(metadata_path(samples_path), "w") as f:
+            json.dump(metadata, f, indent=2)
+
+    print(f"Hasil benchmark disimpan ke {output} (metadata: {meta_path})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+import argparse
+import itertools
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from reports.cpu_benchmark import (
+    cpu_model,
+    load_frames,
+    package_versions,
+    pin_threads,
+    select_checkpoints,
+)
+from utils.load_data import SWEEP_PARAMETERS, SWEEP_RESULTS_FILE
+from utils.model_backends import checkpoint_hash, load_backend_model
+from utils.model_catalog import checkpoint_model_name
+
+SWEEP_BATCH_SIZES = [1, 2, 4, 8, 16]
+
+SWEEP_IMAGE_SIZES = [320, 480, 640, 960, 1280]
+
+SWEEP_THREADS = sorted({1, 2, 4, os.cpu_count() or 1})
+
+# Ukuran gambar dasar selama batch size dan thread di-sweep
+SWEEP_BASELINE_IMAGE_SIZE = 640
+
+SWEEP_WARMUP = 3
+
+SWEEP_ITERATIONS = 20
+
+SWEEP_MAX_IMAGES = 64
+
+
+def sweep_baseline(values: dict) -> dict:
+    """Nilai tetap untuk parameter yang tidak sedang di-sweep."""
+    image_sizes = values["Image Size"]
+    return {
+        "Batch Size": min(values["Batch Size"]),
+        "Image Size": (
+            SWEEP_BASELINE_IMAGE_SIZE
+            if SWEEP_BASELINE_IMAGE_SIZE in image_sizes
+            else image_sizes[0]
+        ),
+        "Threads": max(values["Threads"]),
+    }
+
+
+def sweep_configs(values: dict, baseline: dict, grid: bool = False) -> list:
+    """Daftar konfigurasi (batch, imgsz, threads) yang diukur.
+
+    Tanpa `grid`, setiap parameter di-sweep satu per satu sementara dua
+    parameter lainnya tetap di `baseline`. Dengan `grid`, semua kombinasi
+    diukur.
+    """
+    if grid:
+        configs = itertools.product(*(values[param] for param in SWEEP_PARAMETERS))
+    else:
+        configs = []
+        for param in SWEEP_PARAMETERS:
+            for value in values[param]:
+                config = dict(baseline, **{param: value})
+                configs.append(tuple(config[p] for p in SWEEP_PARAMETERS))
+
+    # Urutkan per jumlah thread supaya thread pool jarang diubah
+    return sorted(set(configs), key=lambda c: (c[2], c[0], c[1]))
+
+
+def benchmark_config(
+    model, frames: list, batch_size: int, imgsz: int, warmup: int, iterations: int
+) -> np.ndarray:
+    """Waktu wall-clock (ms) per panggilan model untuk satu batch di CPU."""
+    batches = [
+        [frames[(i * batch_size + j) % len(frames)] for j in range(batch_size)]
+        for i in range(warmup + iterations)
+    ]
+
+    for batch in batches[:warmup]:
+        model(batch, imgsz=imgsz, device="cpu", verbose=False)
+
+    timings = []
+    for batch in batches[warmup:]:
+        start = time.perf_counter()
+        model(batch, imgsz=imgsz, device="cpu", verbose=False)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return np.asarray(timings)
+
+
+def sweep_row(model_name: str, config: tuple, timings: np.ndarray) -> dict:
+    batch_size = config[0]
+    latency = float(timings.mean())
+
+    return {
+        "Model": model_name,
+        **dict(zip(SWEEP_PARAMETERS, config)),
+        "Throughput (FPS)": round(batch_size * 1000 / latency, 4),
+        "Latency (ms)": round(latency, 4),
+        "Latency p95 (ms)": round(float(np.percentile(timings, 95)), 4),
+    }
+
+
+def run_sweep(args) -> tuple:
+    frames = load_frames(args.images, args.max_images)
+    checkpoints = select_checkpoints(args.model)
+
+    values = {
+        "Batch Size": args.batch_sizes,
+        "Image Size": args.image_sizes,
+        "Threads": args.threads,
+    }
+    baseline = sweep_baseline(values)
+    configs = sweep_configs(values, baseline, args.grid)
+
+    rows = []
+    hashes = {}
+    for checkpoint in checkpoints:
+        model_name = checkpoint_model_name(checkpoint.name)
+        model = load_backend_model(checkpoint.name, "PyTorch")
+
+        for config in configs:
+            batch_size, imgsz, threads = config
+            print(
+                f"Sweep {model_name}: batch={batch_size} imgsz={imgsz} "
+                f"threads={threads}"
+            )
+
+            pin_threads(threads)
+            timings = benchmark_config(
+                model, frames, batch_size, imgsz, args.warmup, args.iterations
+            )
+            rows.append(sweep_row(model_name, config, timings))
+
+        hashes[checkpoint.name] = checkpoint_hash(checkpoint)
+
+    metadata = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "cpu": cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "mode": "grid" if args.grid else "one-at-a-time",
+        "baseline": baseline,
+        "warmup": args.warmup,
+        "iterations": args.iterations,
+        "images": len(frames),
+        "image_dir": str(args.images),
+        "packages": package_versions(),
+        "checkpoints": hashes,
+    }
+
+    return pd.DataFrame(rows), metadata
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Sweep batch size, image size, dan jumlah thread untuk semua "
+            "checkpoint di models/ (CPU, PyTorch)."
+        )
+    )
+    parser.add_argument("--images", required=True, help="Folder gambar uji.")
+    parser.add_argument(
+        "--dataset",
+        default="human-face-emotion-computer-vision-model",
+        help="Folder data tujuan.",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help=f"File CSV hasil (default: data/<dataset>/{SWEEP_RESULTS_FILE}).",
+    )
+    parser.add_argument(
+        "--model",
+        action="append",
+        help="Hanya sweep model ini (boleh diulang, misalnya YOLOv8n).",
+    )
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=SWEEP_BATCH_SIZES
+    )
+    parser.add_argument(
+        "--image-sizes", type=int, nargs="+", default=SWEEP_IMAGE_SIZES
+    )
+    parser.add_argument("--threads", type=int, nargs="+", default=SWEEP_THREADS)
+    parser.add_argument(
+        "--grid",
+        action="store_true",
+        help="Ukur semua kombinasi, bukan satu parameter per sweep.",
+    )
+    parser.add_argument("--warmup", type=int, default=SWEEP_WARMUP)
+    parser.add_argument("--iterations", type=int, default=SWEEP_ITERATIONS)
+    parser.add_argument("--max-images", type=int, default=SWEEP_MAX_IMAGES)
+    args = parser.parse_args()
+
+    output = Path(args.output or Path("data") / args.dataset / SWEEP_RESULTS_FILE)
+
+    results, metadata = run_sweep(args)
+    results.to_csv(output, index=False)
+
+    meta_path = output.with_name(f"{output.stem}.meta.json")
+    with open(meta_path, "w") as f:
+        json.dump(metadata, f, indent=2)
+
+    print(f"Hasil sweep disimpan ke {output} (metadata: {meta_path})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,499 @@
+import time
+import uuid
+
+import pandas as pd
+import streamlit as st
+
+from utils.download_data import download_button
+from utils.frame_pipeline import FramePipeline, batch_inference
+from utils.frame_render import (
+    JPEG_QUALITY,
+    RENDER_MAX_FPS,
+    RENDER_WIDTH,
+    FramePacer,
+    OverlayRenderer,
+    encode_jpeg,
+    plot_renderer,
+)
+from utils.frame_sources import SOURCE_TYPES, open_source
+from utils.inference_worker import SharedInferenceWorker
+from utils.latency_telemetry import TELEMETRY_WINDOW, LatencyTelemetry, speed_timings
+from utils.mjpeg_server import get_mjpeg_server, stream_url
+from utils.model_backends import (
+    MODELS_DIR,
+    available_backends,
+    benchmark_backends,
+    checkpoint_size,
+    collect_frames,
+    load_backend_model,
+)
+from utils.model_catalog import checkpoint_model_name
+from utils.motion_gate import MOTION_MAX_SKIP, MOTION_THRESHOLD, GatedModel, MotionGate
+
+DEMO_MODES = ["Pipeline (thread terpisah)", "Serial"]
+
+RENDER_MODES = ["Ringan (overlay + JPEG)", "Penuh (Ultralytics plot)"]
+
+# MJPEG opt-in: butuh port stream yang bisa dijangkau browser penonton
+DELIVERY_MODES = ["st.image per frame", "Stream MJPEG"]
+
+STREAM_REFRESH_SECONDS = 1
+
+TELEMETRY_REFRESH_FRAMES = 15
+
+
+def telemetry_panel(
+    telemetry, stats_slot, spark_slot, status_slot, gate=None, worker=None
+):
+    stats_slot.dataframe(telemetry.percentiles())
+    spark_slot.line_chart(telemetry.recent(), height=150)
+
+    with status_slot.container():
+        if gate is not None and gate.frames:
+            st.caption(
+                f"Motion gating: model dijalankan pada {gate.inferred} dari "
+                f"{gate.frames} frame ({gate.inferred / gate.frames:.0%})"
+            )
+
+        if worker is not None:
+            stats = worker.stats()
+            st.caption(
+                f"Worker bersama: {stats['clients']} sesi aktif · "
+                f"antrean {stats['queue_depth']} frame · "
+                f"rata-rata batch {stats['mean_batch']:.1f} "
+                f"(maks {stats['max_batch']}) · "
+                f"tunggu {stats['mean_wait_ms']:.1f} ms · "
+                f"{stats['frames']} frame total"
+            )
+
+
+def record_frame(telemetry, timings: dict, refresh):
+    telemetry.record(timings)
+    if telemetry.frames % TELEMETRY_REFRESH_FRAMES == 0:
+        refresh()
+
+
+def show_frame(FRAME_WINDOW, image):
+    # Bytes JPEG dari OverlayRenderer diteruskan tanpa encode ulang
+    if isinstance(image, bytes):
+        FRAME_WINDOW.image(image, output_format="JPEG", width="stretch")
+    else:
+        FRAME_WINDOW.image(image, channels="BGR", width="stretch")
+
+
+def run_serial(camera, model, FRAME_WINDOW, telemetry, refresh, renderer, pacer):
+    while st.session_state.run:
+        start = time.perf_counter()
+        ret, frame = camera.read()
+        if not ret:
+            st.error("Failed to access webcam.")
+            break
+
+        captured_at = time.perf_counter()
+        # Frame di atas batas FPS tampilan dibuang sebelum inferensi
+        if not pacer.ready():
+            continue
+
+        results = model(frame, verbose=False)
+
+        plot_start = time.perf_counter()
+        annotated_frame = renderer(frame, results[0])
+        render_start = time.perf_counter()
+
+        show_frame(FRAME_WINDOW, annotated_frame)
+        rendered_at = time.perf_counter()
+
+        timings = speed_timings(results[0].speed)
+        timings["Capture"] = (captured_at - start) * 1000
+        timings["Plot"] = (render_start - plot_start) * 1000
+        timings["Render"] = (rendered_at - render_start) * 1000
+        timings["End-to-End"] = (rendered_at - captured_at) * 1000
+        record_frame(telemetry, timings, refresh)
+
+
+def run_pipelined(camera, model, FRAME_WINDOW, telemetry, refresh, renderer, pacer):
+    # Capture dan inferensi jalan di thread sendiri; thread script hanya
+    # merender frame hasil inferensi terbaru
+    pipeline = FramePipeline(camera, model, renderer=renderer, pacer=pacer).start()
+
+    try:
+        while st.session_state.run and pipeline.running:
+            packet = pipeline.latest()
+            if packet is None:
+                continue
+
+            render_start = time.perf_counter()
+            show_frame(FRAME_WINDOW, packet.annotated)
+            rendered_at = time.perf_counter()
+
+            packet.timings["Render"] = (rendered_at - render_start) * 1000
+            packet.timings["End-to-End"] = (rendered_at - packet.captured_at) * 1000
+            record_frame(telemetry, packet.timings, refresh)
+    finally:
+        pipeline.stop()
+
+    if pipeline.error:
+        st.error(pipeline.error)
+
+
+def run_streamed(camera, model, FRAME_WINDOW, telemetry, refresh, renderer, pacer):
+    try:
+        broadcaster = get_mjpeg_server()
+    except OSError as err:
+        st.warning(f"Server MJPEG tidak bisa dijalankan ({err}), memakai st.image.")
+        run_pipelined(camera, model, FRAME_WINDOW, telemetry, refresh, renderer, pacer)
+        return
+
+    # Nomor run membuat URL berubah sehingga browser membuka koneksi baru
+    # setiap kali webcam dinyalakan ulang
+    stream_id = st.session_state.setdefault("demo_stream_id", uuid.uuid4().hex)
+    stream_run = st.session_state.get("demo_stream_run", 0) + 1
+    st.session_state.demo_stream_run = stream_run
+
+    FRAME_WINDOW.markdown(
+        f'<img src="{stream_url(stream_id, stream_run)}" style="width: 100%">',
+        unsafe_allow_html=True,
+    )
+
+    def publish(packet):
+        start = time.perf_counter()
+        jpeg = packet.annotated
+        if not isinstance(jpeg, bytes):
+            jpeg = encode_jpeg(jpeg)
+        broadcaster.publish(stream_id, jpeg)
+        published_at = time.perf_counter()
+
+        packet.timings["Render"] = (published_at - start) * 1000
+        packet.timings["End-to-End"] = (published_at - packet.captured_at) * 1000
+        telemetry.record(packet.timings)
+
+    # Frame dikirim langsung dari thread inferensi ke server MJPEG; thread
+    # script hanya memperbarui telemetri
+    pipeline = FramePipeline(
+        camera, model, renderer=renderer, pacer=pacer, sink=publish
+    ).start()
+
+    try:
+        while st.session_state.run and pipeline.running:
+            time.sleep(STREAM_REFRESH_SECONDS)
+            refresh()
+    finally:
+        pipeline.stop()
+        broadcaster.close(stream_id)
+
+    if pipeline.error:
+        st.error(pipeline.error)
+
+
+def batch_stats_summary(stats):
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Frame Diproses", stats.frames)
+    c2.metric("Waktu Total (s)", f"{stats.elapsed:.2f}")
+    c3.metric("Throughput (FPS)", f"{stats.fps:.2f}")
+
+    per_frame = stats.per_frame_ms()
+    stage_data = pd.DataFrame(
+        {
+            "Tahap": list(stats.stage_ms),
+            "Total (ms)": [round(ms, 2) for ms in stats.stage_ms.values()],
+            "Per Frame (ms)": [round(ms, 2) for ms in per_frame.values()],
+        }
+    )
+    st.dataframe(stage_data, hide_index=True)
+
+
+def batch_demo(model, source_type: str, FRAME_WINDOW):
+    path = st.text_input(
+        "Path file video / folder gambar di server:", key="demo_source_path"
+    )
+
+    b1, b2 = st.columns(2)
+    with b1:
+        batch_size = st.number_input(
+            "Batch size:", min_value=1, max_value=64, value=8, key="demo_batch_size"
+        )
+    with b2:
+        render = st.checkbox("Render anotasi (preview)", key="demo_render")
+
+    if not st.button("▶️ Jalankan Inferensi Batch", width="stretch"):
+        return
+
+    try:
+        source = open_source(source_type, path)
+    except FileNotFoundError as err:
+        st.error(str(err))
+        return
+
+    total = len(source)
+    progress = st.progress(0.0)
+    stats = None
+
+    try:
+        for stats, annotated in batch_inference(source, model, batch_size, render):
+            progress.progress(
+                min(stats.frames / total, 1.0) if total else 0.0,
+                text=f"{stats.frames}/{total or '?'} frame · {stats.fps:.1f} FPS",
+            )
+
+            if annotated is not None:
+                FRAME_WINDOW.image(
+                    annotated,
+                    channels="BGR",
+                    width="stretch",
+                )
+    finally:
+        source.release()
+
+    if stats is None:
+        st.warning("Tidak ada frame yang bisa dibaca dari sumber ini.")
+        return
+
+    batch_stats_summary(stats)
+
+
+def backend_benchmark(model_name: str, load_model, source_type: str):
+    with st.expander("⚡ Benchmark Backend"):
+        backends = st.multiselect(
+            "Backend yang dibandingkan:",
+            available_backends(),
+            default=available_backends(),
+            key="demo_benchmark_backends",
+        )
+        n_frames = st.number_input(
+            "Jumlah frame:",
+            min_value=5,
+            max_value=500,
+            value=30,
+            key="demo_benchmark_frames",
+        )
+
+        if st.button("Jalankan Benchmark", key="demo_benchmark_run") and backends:
+            try:
+                source = open_source(
+                    source_type, st.session_state.get("demo_source_path")
+                )
+            except FileNotFoundError as err:
+                st.error(str(err))
+                return
+
+            try:
+                frames = collect_frames(source, n_frames)
+            finally:
+                source.release()
+
+            if not frames:
+                st.error("Tidak ada frame yang bisa dibaca dari sumber ini.")
+                return
+
+            # Semua backend diukur pada frame yang sama
+            with st.spinner("Export model dan mengukur setiap backend..."):
+                models = {
+                    backend: load_model(model_name, backend) for backend in backends
+                }
+                st.session_state.demo_benchmark = benchmark_backends(models, frames)
+
+        result = st.session_state.get("demo_benchmark")
+        if result is not None:
+            st.dataframe(result, hide_index=True)
+
+
+def demo_page(model_name: str):
+
+    st.title("Live FER Demo")
+    st.text("Model used : " + model_name)
+    
+    @st.cache_resource
+    def load_model(model_name, backend):
+        return load_backend_model(model_name, backend)
+
+    # Satu worker per model untuk semua sesi browser
+    @st.cache_resource
+    def load_worker(model_name, backend, _model):
+        return SharedInferenceWorker(_model)
+
+    backend = st.selectbox(
+        "Backend runtime:", available_backends(), key="demo_backend"
+    )
+
+    try:
+        model = load_model(model_name, backend)
+    except Exception as err:
+        st.error(f"Gagal memuat backend {backend}, memakai PyTorch: {err}")
+        backend = "PyTorch"
+        model = load_model(model_name, backend)
+
+    source_type = st.selectbox("Sumber frame:", SOURCE_TYPES, key="demo_source")
+
+    backend_benchmark(model_name, load_model, source_type)
+
+    if source_type != "Webcam":
+        batch_demo(model, source_type, st.image([], width="stretch"))
+        return
+
+    if "run" not in st.session_state:
+        st.session_state.run = False
+
+    delivery = st.radio(
+        "Pengiriman frame:", DELIVERY_MODES, horizontal=True, key="demo_delivery"
+    )
+    if delivery == DELIVERY_MODES[1]:
+        st.caption(
+            "Frame dikirim lewat stream MJPEG terpisah (selalu mode pipeline); "
+            "setiap penonton menerima frame sesuai kecepatannya sendiri."
+        )
+        mode = DEMO_MODES[0]
+    else:
+        mode = st.radio(
+            "Mode eksekusi:", DEMO_MODES, horizontal=True, key="demo_mode"
+        )
+
+    render_mode = st.radio(
+        "Render frame:", RENDER_MODES, horizontal=True, key="demo_render_mode"
+    )
+    r1, r2, r3 = st.columns(3)
+    with r1:
+        max_fps = st.slider(
+            "Maks FPS tampilan:",
+            min_value=1,
+            max_value=30,
+            value=RENDER_MAX_FPS,
+            key="demo_max_fps",
+        )
+    if render_mode == RENDER_MODES[0]:
+        with r2:
+            render_width = st.slider(
+                "Lebar frame (px):",
+                min_value=320,
+                max_value=1280,
+                value=RENDER_WIDTH,
+                step=160,
+                key="demo_render_width",
+            )
+        with r3:
+            jpeg_quality = st.slider(
+                "Kualitas JPEG:",
+                min_value=30,
+                max_value=95,
+                value=JPEG_QUALITY,
+                step=5,
+                key="demo_jpeg_quality",
+            )
+        renderer = OverlayRenderer(render_width, jpeg_quality)
+    else:
+        renderer = plot_renderer
+
+    shared = st.checkbox(
+        "Worker inferensi bersama (batching lintas sesi)",
+        value=False,
+        key="demo_shared_worker",
+    )
+    worker = load_worker(model_name, backend, model) if shared else None
+
+    gated = st.checkbox(
+        "Motion gating (lewati inferensi saat scene statis)", key="demo_motion_gate"
+    )
+    if gated:
+        g1, g2 = st.columns(2)
+        with g1:
+            threshold = st.slider(
+                "Ambang perubahan frame (0–255):",
+                min_value=1.0,
+                max_value=30.0,
+                value=MOTION_THRESHOLD,
+                step=0.5,
+                key="demo_motion_threshold",
+            )
+        with g2:
+            max_skip = st.slider(
+                "Jalankan model minimal setiap N frame:",
+                min_value=1,
+                max_value=60,
+                value=MOTION_MAX_SKIP,
+                key="demo_motion_max_skip",
+            )
+
+    if st.button("🎥 Start / Stop Webcam", width="stretch"):
+        st.session_state.run = not st.session_state.run
+        if st.session_state.run:
+            st.session_state.demo_telemetry = LatencyTelemetry()
+
+    run = st.session_state.run
+
+    # Gate dibuat ulang setiap loop dimulai agar memakai pengaturan terbaru
+    if run:
+        st.session_state.demo_gate = (
+            MotionGate(threshold, max_skip) if gated else None
+        )
+    gate = st.session_state.get("demo_gate")
+
+    FRAME_WINDOW = st.image([], width="stretch")
+
+    # Telemetri disimpan di session state agar tetap terlihat dan bisa
+    # diunduh setelah webcam dihentikan
+    telemetry = st.session_state.setdefault("demo_telemetry", LatencyTelemetry())
+
+    st.subheader("Telemetri Latensi")
+    st.caption(f"Persentil waktu per tahap (ms) dari {TELEMETRY_WINDOW} frame terakhir")
+
+    t1, t2 = st.columns([3, 2])
+    stats_slot = t1.empty()
+    spark_slot = t2.empty()
+    status_slot = st.empty()
+
+    def refresh():
+        telemetry_panel(telemetry, stats_slot, spark_slot, status_slot, gate, worker)
+
+    refresh()
+
+    if telemetry.frames and not run:
+        download_button(
+            telemetry.overall_frame(
+                checkpoint_model_name(model_name),
+                checkpoint_size(MODELS_DIR / model_name),
+            ),
+            "📥 Download",
+            "live_latency_yolo_demo.csv",
+        )
+
+    if run:
+        camera = open_source(source_type)
+        live_model = worker if worker is not None else model
+        pacer = FramePacer(max_fps)
+        if gate is not None:
+            live_model = GatedModel(live_model, gate)
+
+        # Tombol Stop memicu rerun yang menghentikan loop di tengah jalan,
+        # jadi kamera dilepas di finally
+        try:
+            if delivery == DELIVERY_MODES[1]:
+                run_streamed(
+                    camera,
+                    live_model,
+                    FRAME_WINDOW,
+                    telemetry,
+                    refresh,
+                    renderer,
+                    pacer,
+                )
+            elif mode == DEMO_MODES[0]:
+                run_pipelined(
+                    camera,
+                    live_model,
+                    FRAME_WINDOW,
+                    telemetry,
+                    refresh,
+                    renderer,
+                    pacer,
+                )
+            else:
+                run_serial(
+                    camera,
+                    live_model,
+                    FRAME_WINDOW,
+                    telemetry,
+                    refresh,
+                    renderer,
+                    pacer,
+                )
+        finally:
+            camera.release()
@@ -0,0 +1,198 @@
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+from reports.cpu_benchmark import (
+    THREAD_PINNED_BACKENDS,
+    cpu_model,
+    load_frames,
+    package_versions,
+    pin_threads,
+    select_checkpoints,
+)
+from utils.load_data import FOOTPRINT_RESULTS_FILE
+from utils.model_backends import (
+    artifact_megabytes,
+    available_backends,
+    backend_artifact,
+    checkpoint_hash,
+    load_artifact,
+)
+from utils.model_catalog import checkpoint_model_name
+
+FOOTPRINT_STEADY_ITERATIONS = 30
+
+FOOTPRINT_MAX_IMAGES = 8
+
+
+def peak_rss_megabytes() -> float:
+    # VmHWM bisa di-reset lewat clear_refs, ru_maxrss tidak
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def reset_peak_rss() -> bool:
+    """Reset puncak RSS proses (Linux ≥ 4.0); False jika tidak didukung."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def profile_in_process(
+    artifact: str, backend: str, image_dir: str, threads: int, iterations: int
+) -> dict:
+    """Dijalankan di proses baru: ukur load, inferensi pertama, dan steady-state.
+
+    Setiap pengukuran memakai proses sendiri supaya memori dan cache model
+    sebelumnya tidak ikut terhitung. `artifact` sudah di-resolve oleh proses
+    induk, jadi load time tidak mencakup export maupun hash checkpoint.
+    """
+    pin_threads(threads)
+    frames = load_frames(image_dir, FOOTPRINT_MAX_IMAGES)
+
+    start = time.perf_counter()
+    model = load_artifact(Path(artifact), backend)
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model(frames[0], device="cpu", verbose=False)
+    first_ms = (time.perf_counter() - start) * 1000
+    peak_first = peak_rss_megabytes()
+
+    # Tanpa reset, puncak steady-state sama dengan puncak seumur proses
+    peak_reset = reset_peak_rss()
+    for i in range(iterations):
+        model(frames[i % len(frames)], device="cpu", verbose=False)
+    peak_steady = peak_rss_megabytes()
+
+    return {
+        "Load Time (s)": load_seconds,
+        "First Inference (ms)": first_ms,
+        "Peak RSS First (MB)": peak_first,
+        "Peak RSS Steady (MB)": peak_steady,
+        "Peak RSS Reset": peak_reset,
+    }
+
+
+def profile_checkpoint(checkpoint: Path, backend: str, args) -> dict:
+    # Export dilakukan di proses induk agar tidak ikut terhitung load time
+    artifact = backend_artifact(checkpoint.name, backend)
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        measured = pool.submit(
+            profile_in_process,
+            str(artifact),
+            backend,
+            str(args.images),
+            args.threads,
+            args.iterations,
+        ).result()
+
+    row = {
+        "Model": checkpoint_model_name(checkpoint.name),
+        "Backend": backend,
+        "Disk Size (MB)": artifact_megabytes(artifact),
+        **measured,
+    }
+    return {
+        col: round(value, 4) if isinstance(value, float) else value
+        for col, value in row.items()
+    }
+
+
+def run_profiler(args) -> tuple:
+    checkpoints = select_checkpoints(args.model)
+    backends = args.backend or available_backends()
+
+    rows = []
+    hashes = {}
+    for checkpoint in checkpoints:
+        for backend in backends:
+            print(f"Profil {checkpoint.name} ({backend})...")
+            rows.append(profile_checkpoint(checkpoint, backend, args))
+
+        hashes[checkpoint.name] = checkpoint_hash(checkpoint)
+
+    metadata = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "cpu": cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "threads": args.threads,
+        "threads_pinned": [b for b in backends if b in THREAD_PINNED_BACKENDS],
+        "iterations": args.iterations,
+        "packages": package_versions(),
+        "checkpoints": hashes,
+    }
+
+    return pd.DataFrame(rows), metadata
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Ukur load time, puncak RSS, dan ukuran file setiap checkpoint di "
+            "models/ per backend, masing-masing di proses terpisah."
+        )
+    )
+    parser.add_argument("--images", required=True, help="Folder gambar uji.")
+    parser.add_argument(
+        "--dataset",
+        default="human-face-emotion-computer-vision-model",
+        help="Folder data tujuan.",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help=f"File CSV hasil (default: data/<dataset>/{FOOTPRINT_RESULTS_FILE}).",
+    )
+    parser.add_argument(
+        "--model",
+        action="append",
+        help="Hanya profil model ini (boleh diulang, misalnya YOLOv8n).",
+    )
+    parser.add_argument(
+        "--backend",
+        action="append",
+        choices=available_backends(),
+        help="Backend yang diprofil (default: semua yang terpasang).",
+    )
+    parser.add_argument("--threads", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--iterations", type=int, default=FOOTPRINT_STEADY_ITERATIONS
+    )
+    args = parser.parse_args()
+
+    output = Path(
+        args.output or Path("data") / args.dataset / FOOTPRINT_RESULTS_FILE
+    )
+
+    results, metadata = run_profiler(args)
+    results.to_csv(output, index=False)
+
+    meta_path = output.with_name(f"{output.stem}.meta.json")
+    with open(meta_path, "w") as f:
+        json.dump(metadata, f, indent=2)
+
+    print(f"Hasil profil disimpan ke {output} (metadata: {meta_path})")
+
+
+if __name__ == "__main__":
+    main()
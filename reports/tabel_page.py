@@ -1,121 +1,117 @@
+import numpy as np
 import streamlit as st
 
 from table.yolo_tabel import (accuracy_table, class_emotions_table,
                               efficiency_table)
-from utils.download_data import download_to_excel
-from utils.filter import table_filter
-
-
-def table_sections(overall_data, all_class_data, dataset):
-    accuracy_data = overall_data[
-        [
-            "Index",
-            "Model",
-            "Size",
-            "Precision",
-            "Recall",
-            "F1-Score",
-            "mAP50",
-            "mAP50-95",
-        ]
-    ].copy()
+from utils.download_data import download_button
+from utils.filter import table_filter, table_pagination
+from utils.load_data import (
+    DERIVED_COLUMNS,
+    footprint_columns,
+    latency_columns,
+    load_metric_cube,
+)
+
+ACCURACY_COLUMNS = [
+    "Index",
+    "Model",
+    "Size",
+    "Precision",
+    "Recall",
+    "F1-Score",
+    "mAP50",
+    "mAP50-95",
+]
+
+EFFICIENCY_COLUMNS = [
+    "Index",
+    "Model",
+    "Size",
+    "Preprocessing (ms)",
+    "Inference (ms)",
+    "Postprocessing (ms)",
+    "Total Time (ms)",
+    "FPS",
+    "Training Time",
+    "training_seconds",
+]
+
+
+def efficiency_columns(data):
+    # Percentil Total Time dan footprint hanya ditampilkan jika datanya tersedia
+    total = EFFICIENCY_COLUMNS.index("Total Time (ms)") + 1
+    fps = EFFICIENCY_COLUMNS.index("FPS") + 1
+    return (
+        EFFICIENCY_COLUMNS[:total]
+        + latency_columns(data)
+        + EFFICIENCY_COLUMNS[total:fps]
+        + footprint_columns(data)
+        + EFFICIENCY_COLUMNS[fps:]
+    )
+
+
+def class_map50_data(dataset):
+    pivot_all_class_data = load_metric_cube(dataset).frame("mAP50").reset_index()
+    pivot_all_class_data["Index"] = np.arange(1, len(pivot_all_class_data) + 1)
+
+    cols = []
+    cols.append("Index")
+    for col in pivot_all_class_data.columns:
+        if col != "Index":
+            cols.append(col)
+
+    return pivot_all_class_data[cols].reset_index(drop=True)
+
+
+def table_sections(overall_data, dataset):
+    top_k = st.number_input(
+        "Tebalkan top-k nilai terbaik per kolom:",
+        min_value=1,
+        max_value=5,
+        value=1,
+        key="table_top_k",
+    )
+
+    accuracy_data = overall_data[ACCURACY_COLUMNS].copy()
     sorted_accuracy_data = table_filter(accuracy_data, "accuracy")
 
     st.subheader("Tabel Akurasi Model")
-    accuracy_table(sorted_accuracy_data)
-
-    excel_data = download_to_excel(sorted_accuracy_data)
+    rows = table_pagination(sorted_accuracy_data, "accuracy")
+    accuracy_table(sorted_accuracy_data, top_k, rows)
 
-    st.download_button(
-        label="📥 Download Excel",
-        data=excel_data,
-        file_name="accuracy_yolo_comparison_data.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    download_button(
+        sorted_accuracy_data,
+        "📥 Download",
+        "accuracy_yolo_comparison_data.xlsx",
     )
 
     st.divider()
 
-    efficiency_data = overall_data[
-        [
-            "Index",
-            "Model",
-            "Size",
-            "Preprocessing (ms)",
-            "Inference (ms)",
-            "Postprocessing (ms)",
-            "Total Time (ms)",
-            "FPS",
-            "Training Time",
-        ]
-    ]
+    efficiency_data = overall_data[efficiency_columns(overall_data)]
     sorted_efficiency_data = table_filter(efficiency_data, "efficiency")
 
     st.subheader("Tabel Efisiensi Model")
-    efficiency_table(sorted_efficiency_data)
+    rows = table_pagination(sorted_efficiency_data, "efficiency")
+    efficiency_table(sorted_efficiency_data, top_k, rows)
 
-    excel_data = download_to_excel(sorted_efficiency_data)
-
-    st.download_button(
-        label="📥 Download Excel",
-        data=excel_data,
-        file_name="efficiency_yolo_comparison_data.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    download_button(
+        sorted_efficiency_data.drop(columns=DERIVED_COLUMNS, errors="ignore"),
+        "📥 Download",
+        "efficiency_yolo_comparison_data.xlsx",
     )
 
     st.divider()
 
-    model_order = {
-        1: "YOLOv8n",
-        2: "YOLOv8s",
-        3: "YOLOv8m",
-        4: "YOLOv8l",
-        5: "YOLOv9t",
-        6: "YOLOv9s",
-        7: "YOLOv9m",
-        8: "YOLOv9c",
-        9: "YOLOv10n",
-        10: "YOLOv10s",
-        11: "YOLOv10m",
-        12: "YOLOv10l",
-        13: "YOLOv11n",
-        14: "YOLOv11s",
-        15: "YOLOv11m",
-        16: "YOLOv11l",
-        17: "YOLOv12n",
-        18: "YOLOv12s",
-        19: "YOLOv12m",
-        20: "YOLOv12l",
-    }
-
-    pivot_all_class_data = all_class_data.pivot_table(
-        index="Model", columns="Class", values="mAP50"
-    ).reset_index()
-
-    reverse_map = {}
-    for idx, name in model_order.items():
-        reverse_map[name] = idx
-
-    pivot_all_class_data["Index"] = pivot_all_class_data["Model"].map(reverse_map)
-    pivot_all_class_data = pivot_all_class_data.sort_values("Index")
-
-    cols = []
-    cols.append("Index")
-    for col in pivot_all_class_data.columns:
-        if col != "Index":
-            cols.append(col)
-
-    pivot_all_class_data = pivot_all_class_data[cols].reset_index(drop=True)
+    pivot_all_class_data = class_map50_data(dataset)
 
     sorted_all_class_data = table_filter(pivot_all_class_data, "class")
 
     st.subheader("Tabel mAP50 per Kelas Emosi")
-    class_emotions_table(sorted_all_class_data, dataset)
-
-    excel_data = download_to_excel(sorted_all_class_data)
+    rows = table_pagination(sorted_all_class_data, "class")
+    class_emotions_table(sorted_all_class_data, dataset, top_k, rows)
 
-    st.download_button(
-        label="📥 Download Excel",
-        data=excel_data,
-        file_name="class_yolo_comparison_data.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    download_button(
+        sorted_all_class_data,
+        "📥 Download",
+        "class_yolo_comparison_data.xlsx",
     )
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+
+def best_mask(values: np.ndarray, maximize: np.ndarray, top_k: int = 1) -> np.ndarray:
+    """Mask baris terbaik per kolom untuk matriks `values` (baris × kolom).
+
+    Kolom dengan `maximize` False dicari nilai terkecilnya. Nilai yang sama
+    dengan batas top-k ikut ditandai, jadi nilai kembar tetap ditebalkan.
+    """
+    if values.size == 0:
+        return np.zeros(values.shape, dtype=bool)
+
+    signed = np.where(maximize, values, -values)
+    signed = np.where(np.isnan(signed), -np.inf, signed)
+
+    k = min(max(top_k, 1), len(signed))
+    threshold = -np.partition(-signed, k - 1, axis=0)[k - 1]
+
+    return (signed >= threshold) & np.isfinite(signed)
+
+
+def highlight_best(
+    data: pd.DataFrame,
+    rules: dict,
+    top_k: int = 1,
+    keys: dict = None,
+) -> dict:
+    """Bangun sel HTML dengan nilai terbaik ditebalkan.
+
+    `rules` memetakan kolom ke "max" atau "min". `keys` opsional memetakan
+    kolom tampilan ke kolom numerik yang dipakai untuk perbandingan
+    (misalnya "Training Time" → "training_seconds").
+    """
+    keys = keys or {}
+    columns = [col for col in rules if col in data.columns]
+    if not columns:
+        return {}
+
+    values = np.column_stack(
+        [data[keys.get(col, col)].to_numpy(dtype=float) for col in columns]
+    )
+    maximize = np.array([rules[col] == "max" for col in columns])
+    mask = best_mask(values, maximize, top_k)
+
+    # Kolom opsional (misalnya percentil latensi) boleh kosong untuk sebagian model
+    text = data[columns].astype(object).where(data[columns].notna(), "")
+    text = text.astype(str).to_numpy(dtype=str)
+    cells = np.where(mask, np.char.add(np.char.add("<b>", text), "</b>"), text)
+
+    return {col: cells[:, i] for i, col in enumerate(columns)}
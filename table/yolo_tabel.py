@@ -1,28 +1,29 @@
-import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
+from table.highlight import highlight_best
+from utils.load_data import DERIVED_COLUMNS, LATENCY_COLUMNS, footprint_columns
 
-def accuracy_table(data):
-    numerical_cols = ["Precision", "Recall", "F1-Score", "mAP50", "mAP50-95"]
 
-    display = data.copy()
+def comparison_table_figure(data, highlighted, rows=None):
+    # Highlight dihitung dari seluruh data, lalu hanya halaman `rows` yang
+    # dikirim ke browser
+    rows = rows or slice(None)
+    page = data.iloc[rows]
+    start = rows.start or 0
 
-    for col in numerical_cols:
-        max_val = display[col].max()
-        display[col] = display[col].apply(
-            lambda x: f"<b>{x}</b>" if x == max_val else x
-        )
+    columns = [col for col in data.columns if col not in DERIVED_COLUMNS]
 
-    row_colors = []
-    for i in range(len(display)):
-        row_colors.append("#FFFFFF" if i % 2 == 0 else "#F7F7F7")
+    row_colors = np.where(
+        np.arange(start, start + len(page)) % 2 == 0, "#FFFFFF", "#F7F7F7"
+    )
 
     fig_table = go.Figure(
         data=[
             go.Table(
                 header=dict(
-                    values=[f"<b>{col}</b>" for col in display.columns],
+                    values=[f"<b>{col}</b>" for col in columns],
                     fill_color="#E5E5E5",
                     align="center",
                     font=dict(size=14, color="#333"),
@@ -30,13 +31,16 @@ def accuracy_table(data):
                     line_color="#CCCCCC",
                 ),
                 cells=dict(
-                    values=[display[col] for col in display.columns],
+                    values=[
+                        highlighted[col][rows] if col in highlighted else page[col]
+                        for col in columns
+                    ],
                     fill_color=[row_colors],
                     align="center",
                     font=dict(size=13, color="#333"),
                     height=35,
                     line_color="#DDDDDD",
-                    format=["html"] * len(display.columns),
+                    format=["html"] * len(columns),
                 ),
             )
         ]
@@ -44,76 +48,50 @@ def accuracy_table(data):
 
     fig_table.update_layout(
         margin=dict(l=0, r=0, t=10, b=10),
-        height=60 + (len(display) * 35),
+        height=60 + (len(page) * 35),
     )
 
-    st.plotly_chart(fig_table, width="stretch")
+    return fig_table
 
 
-def efficiency_table(data):
-    numerical_cols = [
-        "Preprocessing (ms)",
-        "Inference (ms)",
-        "Postprocessing (ms)",
-        "Total Time (ms)",
-        "FPS",
-    ]
+def accuracy_table_figure(data, top_k=1, rows=None):
+    numerical_cols = ["Precision", "Recall", "F1-Score", "mAP50", "mAP50-95"]
 
-    display = data.copy()
+    highlighted = highlight_best(
+        data, {col: "max" for col in numerical_cols}, top_k=top_k
+    )
 
-    for col in numerical_cols:
-        target_val = display[col].min() if col != "FPS" else display[col].max()
-        display[col] = display[col].apply(
-            lambda x: f"<b>{x}</b>" if x == target_val else x
-        )
+    return comparison_table_figure(data, highlighted, rows)
 
-    training_seconds = pd.to_timedelta(data["Training Time"]).dt.total_seconds()
-    min_time = training_seconds.min()
 
-    display["Training Time"] = display.apply(
-        lambda row: (
-            f"<b>{row['Training Time']}</b>"
-            if pd.to_timedelta(row["Training Time"]).total_seconds() == min_time
-            else row["Training Time"]
-        ),
-        axis=1,
-    )
+def accuracy_table(data, top_k=1, rows=None):
+    st.plotly_chart(accuracy_table_figure(data, top_k, rows), width="stretch")
 
-    row_colors = ["#FFFFFF" if i % 2 == 0 else "#F7F7F7" for i in range(len(display))]
 
-    fig_table = go.Figure(
-        data=[
-            go.Table(
-                header=dict(
-                    values=[f"<b>{col}</b>" for col in display.columns],
-                    fill_color="#E5E5E5",
-                    align="center",
-                    font=dict(size=14, color="#333"),
-                    height=40,
-                    line_color="#CCCCCC",
-                ),
-                cells=dict(
-                    values=[display[col] for col in display.columns],
-                    fill_color=[row_colors],
-                    align="center",
-                    font=dict(size=13, color="#333"),
-                    height=35,
-                    line_color="#DDDDDD",
-                    format=["html"] * len(display.columns),
-                ),
-            )
-        ]
-    )
+def efficiency_table_figure(data, top_k=1, rows=None):
+    rules = {
+        "Preprocessing (ms)": "min",
+        "Inference (ms)": "min",
+        "Postprocessing (ms)": "min",
+        "Total Time (ms)": "min",
+        "FPS": "max",
+        "Training Time": "min",
+        **dict.fromkeys(LATENCY_COLUMNS, "min"),
+        **dict.fromkeys(footprint_columns(data), "min"),
+    }
 
-    fig_table.update_layout(
-        margin=dict(l=0, r=0, t=10, b=10),
-        height=60 + (len(display) * 35),
+    highlighted = highlight_best(
+        data, rules, top_k=top_k, keys={"Training Time": "training_seconds"}
     )
 
-    st.plotly_chart(fig_table, width="stretch")
+    return comparison_table_figure(data, highlighted, rows)
 
 
-def class_emotions_table(data, dataset):
+def efficiency_table(data, top_k=1, rows=None):
+    st.plotly_chart(efficiency_table_figure(data, top_k, rows), width="stretch")
+
+
+def class_emotions_table_figure(data, dataset, top_k=1, rows=None):
     cols = []
     if dataset == "human-face-emotion-computer-vision-model":
         cols = [
@@ -129,43 +107,12 @@ def class_emotions_table(data, dataset):
     elif dataset == "fer-2013":
         cols = ["angry", "disgust", "fear", "happy", "neutral", "sad", "surprise"]
 
-    display = data.copy()
+    highlighted = highlight_best(data, {col: "max" for col in cols}, top_k=top_k)
 
-    for col in cols:
-        max_val = display[col].max()
-        display[col] = display[col].apply(
-            lambda x: f"<b>{x}</b>" if x == max_val else x
-        )
+    return comparison_table_figure(data, highlighted, rows)
 
-    row_colors = ["#FFFFFF" if i % 2 == 0 else "#F7F7F7" for i in range(len(display))]
-
-    fig_table = go.Figure(
-        data=[
-            go.Table(
-                header=dict(
-                    values=[f"<b>{col}</b>" for col in display.columns],
-                    fill_color="#E5E5E5",
-                    align="center",
-                    font=dict(size=14, color="#333"),
-                    height=40,
-                    line_color="#CCCCCC",
-                ),
-                cells=dict(
-                    values=[display[col] for col in display.columns],
-                    fill_color=[row_colors],
-                    align="center",
-                    font=dict(size=13, color="#333"),
-                    height=35,
-                    line_color="#DDDDDD",
-                    format=["html"] * len(display.columns),
-                ),
-            )
-        ]
-    )
 
-    fig_table.update_layout(
-        margin=dict(l=0, r=0, t=10, b=10),
-        height=60 + (len(display) * 35),
+def class_emotions_table(data, dataset, top_k=1, rows=None):
+    st.plotly_chart(
+        class_emotions_table_figure(data, dataset, top_k, rows), width="stretch"
     )
-
-    st.plotly_chart(fig_table, width="stretch")
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / ".cache"
+
+
+def frame_hash(data: pd.DataFrame) -> str:
+    digest = hashlib.sha256()
+    digest.update(repr(list(data.columns)).encode())
+    digest.update(repr(list(data.dtypes.astype(str))).encode())
+    # Urutan kategori (misalnya urutan ModelCatalog) tidak ikut di hash nilai
+    for dtype in data.dtypes:
+        if isinstance(dtype, pd.CategoricalDtype):
+            digest.update(f"{list(dtype.categories)}:{dtype.ordered}".encode())
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _source_prefix(csv_path: Path) -> str:
+    return hashlib.sha1(str(csv_path.resolve()).encode()).hexdigest()[:12]
+
+
+def _cache_key(
+    csv_path: Path, dtype: Optional[dict], names: Optional[list]
+) -> str:
+    stat = csv_path.stat()
+    schema = json.dumps(
+        {
+            "dtype": {col: str(kind) for col, kind in (dtype or {}).items()},
+            "names": names,
+        },
+        sort_keys=True,
+    )
+    raw = f"{stat.st_mtime_ns}:{stat.st_size}:{schema}"
+    return hashlib.sha1(raw.encode()).hexdigest()[:12]
+
+
+def _cache_path(
+    csv_path: Path, dtype: Optional[dict], names: Optional[list]
+) -> Path:
+    prefix = _source_prefix(csv_path)
+    key = _cache_key(csv_path, dtype, names)
+    return CACHE_DIR / f"{csv_path.stem}-{prefix}-{key}.parquet"
+
+
+def _drop_stale(csv_path: Path, keep: Path):
+    pattern = f"{csv_path.stem}-{_source_prefix(csv_path)}-*.parquet"
+    for old in CACHE_DIR.glob(pattern):
+        if old != keep:
+            old.unlink(missing_ok=True)
+
+
+def _write_parquet(data: pd.DataFrame, parquet_path: Path):
+    # Tulis ke file sementara lalu rename, supaya worker lain tidak
+    # pernah membaca parquet yang setengah jadi.
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = parquet_path.with_suffix(f".{os.getpid()}.tmp")
+    data.to_parquet(tmp_path, engine="pyarrow", index=False)
+    os.replace(tmp_path, parquet_path)
+
+
+def read_csv_cached(
+    csv_path: Path, dtype: Optional[dict] = None, names: Optional[list] = None
+) -> pd.DataFrame:
+    """Baca CSV lewat cache Parquet yang dikunci path + mtime + ukuran file.
+
+    Cache otomatis tidak terpakai lagi begitu file sumber berubah, dan
+    entri lama untuk file yang sama langsung dihapus. Jika `names` diisi,
+    header asli diganti dengan nama kolom tersebut.
+    """
+    csv_path = Path(csv_path)
+    parquet_path = _cache_path(csv_path, dtype, names)
+
+    if parquet_path.exists():
+        try:
+            return pd.read_parquet(parquet_path, engine="pyarrow")
+        except Exception:
+            parquet_path.unlink(missing_ok=True)
+
+    if names is not None:
+        data = pd.read_csv(csv_path, dtype=dtype, header=0, names=names)
+    else:
+        data = pd.read_csv(csv_path, dtype=dtype)
+
+    try:
+        _write_parquet(data, parquet_path)
+        _drop_stale(csv_path, parquet_path)
+    except OSError:
+        # Folder data read-only: tetap jalan tanpa cache.
+        pass
+
+    return data
@@ -1,9 +1,111 @@
-import pandas as pd
+import tempfile
 from io import BytesIO
 
+import pandas as pd
+import streamlit as st
+from openpyxl import Workbook
+
+from utils.columnar_cache import frame_hash
+
+DOWNLOAD_FORMATS = {
+    "XLSX": (
+        "xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ),
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+STREAMING_MIN_ROWS = 50_000
+
+STREAMING_CHUNK_ROWS = 10_000
+
+DOWNLOAD_CACHE_ENTRIES = 32
+
 
 def download_to_excel(download):
+    if len(download) >= STREAMING_MIN_ROWS:
+        return download_to_excel_streaming(download)
+
     output = BytesIO()
     with pd.ExcelWriter(output, engine="openpyxl") as writer:
         download.to_excel(writer, index=False, sheet_name="Sheet1")
     return output.getvalue()
+
+
+def download_to_excel_streaming(download, sheet_name="Sheet1"):
+    # Workbook write-only menulis baris langsung ke XML, dan file .xlsx
+    # dirakit di file sementara; hanya hasil akhirnya yang dibaca ke memori
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    sheet.append([str(col) for col in download.columns])
+
+    for start in range(0, len(download), STREAMING_CHUNK_ROWS):
+        chunk = download.iloc[start : start + STREAMING_CHUNK_ROWS].astype(object)
+        chunk = chunk.where(chunk.notna(), None)
+        for row in chunk.itertuples(index=False, name=None):
+            sheet.append(row)
+
+    with tempfile.TemporaryFile(suffix=".xlsx") as output:
+        workbook.save(output)
+        output.seek(0)
+        return output.read()
+
+
+def download_to_csv(download):
+    return download.to_csv(index=False).encode("utf-8")
+
+
+def download_to_parquet(download):
+    output = BytesIO()
+    download.to_parquet(output, index=False)
+    return output.getvalue()
+
+
+@st.cache_data(max_entries=DOWNLOAD_CACHE_ENTRIES, show_spinner=False)
+def export_data(data_hash: str, fmt: str, _download: pd.DataFrame) -> bytes:
+    # Kunci cache hanya hash isi frame dan format; frame-nya sendiri
+    # tidak di-hash ulang oleh Streamlit
+    match fmt:
+        case "csv":
+            return download_to_csv(_download)
+        case "parquet":
+            return download_to_parquet(_download)
+        case _:
+            return download_to_excel(_download)
+
+
+def download_button(download: pd.DataFrame, label: str, file_name: str):
+    stem = file_name.rsplit(".", 1)[0]
+
+    d1, d2 = st.columns([1, 3])
+
+    with d1:
+        fmt_label = st.selectbox(
+            "Format:",
+            list(DOWNLOAD_FORMATS),
+            key=f"download_{stem}_format",
+            label_visibility="collapsed",
+        )
+
+    fmt, mime = DOWNLOAD_FORMATS[fmt_label]
+    data_hash = frame_hash(download)
+    prepared_key = f"download_{stem}_prepared"
+
+    with d2:
+        # File baru dibuat saat diminta, bukan di setiap rerun.
+        if st.session_state.get(prepared_key) != (data_hash, fmt):
+            prepare = st.button(
+                f"📄 Siapkan {fmt_label}", key=f"download_{stem}_prepare"
+            )
+            if not prepare:
+                return
+            st.session_state[prepared_key] = (data_hash, fmt)
+
+        st.download_button(
+            f"{label} {fmt_label}",
+            data=export_data(data_hash, fmt, download),
+            file_name=f"{stem}.{fmt}",
+            mime=mime,
+            key=f"download_{stem}_download",
+        )
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indeks titik hasil Largest-Triangle-Three-Buckets.
+
+    Titik yang dipilih selalu titik asli, jadi nilai hover tetap sama
+    dengan data sumber.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    every = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        avg_start = int(np.floor((i + 1) * every)) + 1
+        avg_end = min(int(np.floor((i + 2) * every)) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+
+        start = int(np.floor(i * every)) + 1
+        end = int(np.floor((i + 1) * every)) + 1
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+
+    return indices
+
+
+def downsample_per_model(
+    data: pd.DataFrame, x: str, y: str, threshold: int
+) -> pd.DataFrame:
+    """LTTB terpisah untuk setiap model, maksimal `threshold` titik per model.
+
+    >>> frame = pd.DataFrame(
+    ...     {"Model": "yolov8n", "epoch": range(300), "map": np.arange(300) % 7}
+    ... )
+    >>> len(downsample_per_model(frame, "epoch", "map", 180))
+    180
+    """
+    data = data.dropna(subset=[y])
+
+    parts = []
+    for _, group in data.groupby("Model", observed=True, sort=False):
+        group = group.sort_values(x)
+        picked = lttb_indices(group[x].to_numpy(), group[y].to_numpy(), threshold)
+        parts.append(group.iloc[picked])
+
+    if not parts:
+        return data
+
+    return pd.concat(parts)
@@ -1,6 +1,11 @@
 import pandas as pd
 import streamlit as st
 
+from utils.load_data import DERIVED_COLUMNS
+from utils.metric_cube import MetricCube
+
+TABLE_PAGE_SIZES = [25, 50, 100, "Semua"]
+
 
 def table_filter(data: pd.DataFrame, prefix: str):
     a1, a2, a3 = st.columns(3)
@@ -18,7 +23,7 @@ def table_filter(data: pd.DataFrame, prefix: str):
     with a2:
         selected_column = st.selectbox(
             "Pilih kolom untuk sorting:",
-            data.columns,
+            [col for col in data.columns if col not in DERIVED_COLUMNS],
             key=f"{prefix}_column",
         )
 
@@ -29,24 +34,15 @@ def table_filter(data: pd.DataFrame, prefix: str):
             key=f"{prefix}_sort",
         )
 
+    if selected_column == "Training Time" and "training_seconds" in data.columns:
+        selected_column = "training_seconds"
+
     match sort_type:
         case "Terkecil → Terbesar":
-            if selected_column == "Training Time":
-                data = data.sort_values(
-                    by=selected_column, ascending=True, key=lambda x: pd.to_timedelta(x)
-                )
-            else:
-                data = data.sort_values(by=selected_column, ascending=True)
+            data = data.sort_values(by=selected_column, ascending=True)
 
         case "Terbesar → Terkecil":
-            if selected_column == "Training Time":
-                data = data.sort_values(
-                    by=selected_column,
-                    ascending=False,
-                    key=lambda x: pd.to_timedelta(x),
-                )
-            else:
-                data = data.sort_values(by=selected_column, ascending=False)
+            data = data.sort_values(by=selected_column, ascending=False)
 
         case "A → Z":
             data = data.sort_values(
@@ -61,32 +57,45 @@ def table_filter(data: pd.DataFrame, prefix: str):
     return data
 
 
-def chart_filter_options(data: pd.DataFrame, prefix: str):
-    model_order_dict = {
-        1: "YOLOv8n",
-        2: "YOLOv8s",
-        3: "YOLOv8m",
-        4: "YOLOv8l",
-        5: "YOLOv9t",
-        6: "YOLOv9s",
-        7: "YOLOv9m",
-        8: "YOLOv9c",
-        9: "YOLOv10n",
-        10: "YOLOv10s",
-        11: "YOLOv10m",
-        12: "YOLOv10l",
-        13: "YOLOv11n",
-        14: "YOLOv11s",
-        15: "YOLOv11m",
-        16: "YOLOv11l",
-        17: "YOLOv12n",
-        18: "YOLOv12s",
-        19: "YOLOv12m",
-        20: "YOLOv12l",
-    }
-
-    model_order = list(model_order_dict.values())
+def table_pagination(data: pd.DataFrame, prefix: str) -> slice:
+    p1, p2 = st.columns(2)
+
+    with p1:
+        page_size = st.selectbox(
+            "Baris per halaman:",
+            TABLE_PAGE_SIZES,
+            key=f"{prefix}_page_size",
+        )
+
+    if page_size == "Semua":
+        return slice(None)
+
+    n_pages = max(1, -(-len(data) // page_size))
+
+    # Jumlah halaman bisa berkurang setelah filter model diubah
+    page_key = f"{prefix}_page"
+    if st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = n_pages
+
+    with p2:
+        page = st.number_input(
+            "Halaman:",
+            min_value=1,
+            max_value=n_pages,
+            step=1,
+            key=page_key,
+        )
+
+    start = (page - 1) * page_size
+    stop = min(start + page_size, len(data))
 
+    if len(data):
+        st.caption(f"Menampilkan baris {start + 1}–{stop} dari {len(data)}")
+
+    return slice(start, stop)
+
+
+def chart_filter_options(data: pd.DataFrame, prefix: str):
     c1, c2, c3 = st.columns(3)
 
     with c1:
@@ -119,14 +128,13 @@ def chart_filter_options(data: pd.DataFrame, prefix: str):
         )
 
     if sort_metric == "None" or sort_direction == "Default":
-        filtered_order = [m for m in model_order if m in data["Model"].unique()]
-        data["Model"] = pd.Categorical(
-            data["Model"], categories=filtered_order, ordered=True
-        )
+        # Model sudah berupa kategori terurut dari ModelCatalog, jadi urutan
+        # default cukup sort kode integer.
+        data["Model"] = data["Model"].cat.remove_unused_categories()
         return data.sort_values("Model")
 
     wide = data.pivot_table(
-        index="Model", columns="Metrics", values="Score"
+        index="Model", columns="Metrics", values="Score", observed=True
     ).reset_index()
 
     if prefix.lower() == "latency" and sort_metric == "Total Time (ms)":
@@ -150,31 +158,6 @@ def chart_filter_options(data: pd.DataFrame, prefix: str):
 
 
 def filter_and_sort_training_data(data: pd.DataFrame):
-    model_order_dict = {
-        1: "YOLOv8n",
-        2: "YOLOv8s",
-        3: "YOLOv8m",
-        4: "YOLOv8l",
-        5: "YOLOv9t",
-        6: "YOLOv9s",
-        7: "YOLOv9m",
-        8: "YOLOv9c",
-        9: "YOLOv10n",
-        10: "YOLOv10s",
-        11: "YOLOv10m",
-        12: "YOLOv10l",
-        13: "YOLOv11n",
-        14: "YOLOv11s",
-        15: "YOLOv11m",
-        16: "YOLOv11l",
-        17: "YOLOv12n",
-        18: "YOLOv12s",
-        19: "YOLOv12m",
-        20: "YOLOv12l",
-    }
-    
-    default_rank = {v: k for k, v in model_order_dict.items()}
-
     t1, t2, t3 = st.columns(3)
 
     with t1:
@@ -194,12 +177,12 @@ def filter_and_sort_training_data(data: pd.DataFrame):
         )
 
         if sort_direction == "Default":
-            data["rank"] = data["Model"].map(default_rank)
-            sorted_df = data.sort_values("rank")
-        else:
-            is_ascending = True if sort_direction == "Ascending" else False
-            sorted_df = data.sort_values("Training Time (menit)", ascending=is_ascending)
-            
+            data["Model"] = data["Model"].cat.remove_unused_categories()
+            return data.sort_values("Model")
+
+        is_ascending = True if sort_direction == "Ascending" else False
+        sorted_df = data.sort_values("Training Time (menit)", ascending=is_ascending)
+
         sorted_models = sorted_df["Model"].tolist()
         data["Model"] = pd.Categorical(
             data["Model"], categories=sorted_models, ordered=True
@@ -208,24 +191,24 @@ def filter_and_sort_training_data(data: pd.DataFrame):
     return data.sort_values("Model")
 
 
-def filter_and_sort_heatmap_data(data: pd.DataFrame):
+def filter_and_sort_heatmap_data(cube: MetricCube):
     h1, h2, h3 = st.columns(3)
 
     with h1:
         selected_models = st.multiselect(
             "Pilih Model yang Ditampilkan:",
-            data["Model"].unique(),
+            cube.models,
             key="heatmap_model_filter",
         )
         if selected_models:
-            data = data[data["Model"].isin(selected_models)]
+            cube = cube.subset(selected_models)
 
     with h2:
         selected_metric = st.selectbox(
             "Pilih Metric:",
-            options=["Default", "Precision", "Recall", "F1-Score", "mAP50", "mAP50-95"],
+            options=["Default"] + list(cube.metrics),
             index=0,
             key="heatmap_metric_filter",
         )
 
-    return data, selected_metric
+    return cube, selected_metric
@@ -0,0 +1,287 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from utils.frame_render import plot_renderer
+from utils.latency_telemetry import speed_timings
+
+PIPELINE_QUEUE_SIZE = 1
+
+PIPELINE_POLL_SECONDS = 0.1
+
+BATCH_QUEUE_SIZE = 4
+
+BATCH_STAGES = [
+    "Decode",
+    "Preprocessing",
+    "Inference",
+    "Postprocessing",
+    "Render",
+]
+
+
+@dataclass
+class FramePacket:
+    index: int
+    frame: Any
+    captured_at: float
+    annotated: Any = None
+    inferred_at: Optional[float] = None
+    timings: dict = field(default_factory=dict)
+
+
+def put_latest(target: queue.Queue, item) -> int:
+    """Masukkan `item` ke queue terbatas, buang item terlama jika penuh.
+
+    Mengembalikan jumlah item yang dibuang.
+    """
+    dropped = 0
+    while True:
+        try:
+            target.put_nowait(item)
+            return dropped
+        except queue.Full:
+            try:
+                target.get_nowait()
+                dropped += 1
+            except queue.Empty:
+                pass
+
+
+class FramePipeline:
+    """Pipeline capture → inferensi → render untuk demo live.
+
+    Capture dan inferensi berjalan di thread masing-masing dan dihubungkan
+    dengan queue berukuran `queue_size`. Frame yang belum sempat diproses
+    dibuang, jadi inferensi selalu mengerjakan frame terbaru. Jika `pacer`
+    belum siap, frame dibuang sebelum inferensi. Anotasi dibuat oleh
+    `renderer(frame, result)` di thread inferensi. Tahap render memanggil
+    `latest()` dari thread script Streamlit, atau jika `sink` diberikan,
+    setiap paket langsung diserahkan ke `sink(packet)` dari thread inferensi.
+    """
+
+    def __init__(
+        self,
+        capture,
+        model,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+        renderer=plot_renderer,
+        pacer=None,
+        sink=None,
+    ):
+        self.capture = capture
+        self.model = model
+        self.renderer = renderer
+        self.pacer = pacer
+        self.sink = sink
+        self.error = None
+        self.dropped = 0
+
+        self._frames = queue.Queue(maxsize=queue_size)
+        self._results = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="demo-capture"),
+            threading.Thread(target=self._inference_loop, name="demo-inference"),
+        ]
+
+    @property
+    def running(self) -> bool:
+        return not self._stop.is_set()
+
+    def start(self):
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        for thread in self._threads:
+            if thread.is_alive():
+                thread.join()
+
+    def latest(self, timeout: float = PIPELINE_POLL_SECONDS):
+        try:
+            return self._results.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _capture_loop(self):
+        index = 0
+        while not self._stop.is_set():
+            start = time.perf_counter()
+            ret, frame = self.capture.read()
+            if not ret:
+                self.error = "Failed to access webcam."
+                self._stop.set()
+                break
+
+            captured_at = time.perf_counter()
+            packet = FramePacket(index, frame, captured_at)
+            packet.timings["Capture"] = (captured_at - start) * 1000
+            self.dropped += put_latest(self._frames, packet)
+            index += 1
+
+    def _inference_loop(self):
+        while not self._stop.is_set():
+            try:
+                packet = self._frames.get(timeout=PIPELINE_POLL_SECONDS)
+            except queue.Empty:
+                continue
+
+            # Frame di atas batas FPS tampilan tidak perlu diinferensi
+            if self.pacer is not None and not self.pacer.ready():
+                continue
+
+            try:
+                results = self.model(packet.frame, verbose=False)
+                plot_start = time.perf_counter()
+                packet.annotated = self.renderer(packet.frame, results[0])
+            except Exception as err:
+                self.error = f"Inferensi gagal: {err}"
+                self._stop.set()
+                break
+
+            packet.inferred_at = time.perf_counter()
+            packet.timings.update(speed_timings(results[0].speed))
+            packet.timings["Plot"] = (packet.inferred_at - plot_start) * 1000
+
+            if self.sink is not None:
+                self.sink(packet)
+            else:
+                self.dropped += put_latest(self._results, packet)
+
+
+@dataclass
+class BatchStats:
+    frames: int = 0
+    elapsed: float = 0.0
+    stage_ms: dict = field(
+        default_factory=lambda: dict.fromkeys(BATCH_STAGES, 0.0)
+    )
+
+    @property
+    def fps(self) -> float:
+        return self.frames / self.elapsed if self.elapsed else 0.0
+
+    def per_frame_ms(self) -> dict:
+        if not self.frames:
+            return dict.fromkeys(BATCH_STAGES, 0.0)
+        return {stage: ms / self.frames for stage, ms in self.stage_ms.items()}
+
+
+class BatchReader:
+    """Decode frame dari sumber offline di thread latar dan kelompokkan per batch.
+
+    Berbeda dengan `FramePipeline`, tidak ada frame yang dibuang: queue yang
+    penuh menahan thread decode sampai inferensi siap menerima batch baru.
+    Error saat decode dilempar ulang dari iterasi setelah batch sebelumnya.
+    """
+
+    def __init__(
+        self, source, batch_size: int, queue_size: int = BATCH_QUEUE_SIZE
+    ):
+        self.source = source
+        self.batch_size = max(batch_size, 1)
+        self.error = None
+
+        self._batches = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._read_loop, name="demo-batch-reader", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        # Kosongkan queue agar thread decode yang sedang menunggu bisa selesai
+        while self._thread.is_alive():
+            try:
+                self._batches.get(timeout=PIPELINE_POLL_SECONDS)
+            except queue.Empty:
+                pass
+
+    def __iter__(self):
+        while True:
+            item = self._batches.get()
+            if item is None:
+                if self.error is not None:
+                    raise self.error
+                return
+            yield item
+
+    def _read_loop(self):
+        batch = []
+        decode_ms = 0.0
+
+        try:
+            while not self._stop.is_set():
+                start = time.perf_counter()
+                ret, frame = self.source.read()
+                if not ret:
+                    break
+
+                decode_ms += (time.perf_counter() - start) * 1000
+                batch.append(frame)
+
+                if len(batch) == self.batch_size:
+                    self._put((batch, decode_ms))
+                    batch = []
+                    decode_ms = 0.0
+        except Exception as err:
+            self.error = err
+        finally:
+            # Sentinel selalu dikirim agar iterasi tidak menunggu selamanya
+            if batch:
+                self._put((batch, decode_ms))
+            self._put(None)
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._batches.put(item, timeout=PIPELINE_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+
+def batch_inference(source, model, batch_size: int, render: bool = False):
+    """Jalankan inferensi per batch atas seluruh `source`.
+
+    Generator ini menghasilkan `(stats, annotated)` setelah setiap batch.
+    `stats` berisi akumulasi sampai batch tersebut. `annotated` adalah frame
+    terakhir yang sudah dianotasi, atau None jika `render` False.
+    """
+    stats = BatchStats()
+    reader = BatchReader(source, batch_size).start()
+    start = time.perf_counter()
+
+    try:
+        for frames, decode_ms in reader:
+            results = model(frames, verbose=False)
+
+            stats.stage_ms["Decode"] += decode_ms
+            for result in results:
+                for stage, ms in speed_timings(result.speed).items():
+                    stats.stage_ms[stage] += ms
+
+            annotated = None
+            if render:
+                render_start = time.perf_counter()
+                for result in results:
+                    annotated = result.plot()
+                render_ms = (time.perf_counter() - render_start) * 1000
+                stats.stage_ms["Render"] += render_ms
+
+            stats.frames += len(frames)
+            stats.elapsed = time.perf_counter() - start
+
+            yield stats, annotated
+    finally:
+        reader.stop()
@@ -0,0 +1,93 @@
+import time
+
+import cv2
+import numpy as np
+
+RENDER_WIDTH = 640
+
+JPEG_QUALITY = 70
+
+RENDER_MAX_FPS = 15
+
+OVERLAY_COLOR = (56, 56, 255)
+
+
+def encode_jpeg(image, quality: int = JPEG_QUALITY) -> bytes:
+    _, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return encoded.tobytes()
+
+
+def plot_renderer(frame, result):
+    """Render bawaan Ultralytics: anotasi penuh di frame resolusi asli."""
+    return result.plot()
+
+
+class OverlayRenderer:
+    """Render ringan: kecilkan frame, gambar box dan label, lalu encode JPEG sekali.
+
+    Hasilnya bytes JPEG yang diteruskan `st.image` apa adanya, jadi
+    Streamlit tidak perlu meng-encode ulang frame.
+    """
+
+    def __init__(self, width: int = RENDER_WIDTH, quality: int = JPEG_QUALITY):
+        self.width = width
+        self.quality = quality
+
+    def __call__(self, frame, result) -> bytes:
+        height, width = frame.shape[:2]
+        scale = min(self.width / width, 1.0)
+        if scale < 1.0:
+            frame = cv2.resize(
+                frame,
+                (self.width, round(height * scale)),
+                interpolation=cv2.INTER_AREA,
+            )
+        else:
+            frame = frame.copy()
+
+        data = result.boxes.data
+        data = data.cpu().numpy() if hasattr(data, "cpu") else np.asarray(data)
+        names = getattr(result, "names", {}) or {}
+
+        for x1, y1, x2, y2, conf, cls in data[:, :6]:
+            p1 = (int(x1 * scale), int(y1 * scale))
+            p2 = (int(x2 * scale), int(y2 * scale))
+            label = f"{names.get(int(cls), int(cls))} {conf:.2f}"
+
+            cv2.rectangle(frame, p1, p2, OVERLAY_COLOR, 2)
+            cv2.putText(
+                frame,
+                label,
+                (p1[0], max(p1[1] - 6, 12)),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.5,
+                OVERLAY_COLOR,
+                1,
+                cv2.LINE_AA,
+            )
+
+        return encode_jpeg(frame, self.quality)
+
+
+class FramePacer:
+    """Batasi frekuensi kirim frame ke browser.
+
+    Streamlit tidak memberi tahu kapan browser selesai menampilkan frame,
+    jadi frame yang datang sebelum interval `1 / max_fps` lewat dibuang.
+    """
+
+    def __init__(self, max_fps: float = RENDER_MAX_FPS):
+        self.interval = 1 / max_fps if max_fps else 0.0
+        self.sent = 0
+        self.skipped = 0
+        self._last = 0.0
+
+    def ready(self) -> bool:
+        now = time.perf_counter()
+        if now - self._last < self.interval:
+            self.skipped += 1
+            return False
+
+        self._last = now
+        self.sent += 1
+        return True
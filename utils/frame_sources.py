@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import cv2
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
+
+SOURCE_TYPES = ["Webcam", "File Video", "Folder Gambar"]
+
+
+class VideoFileSource:
+    """Sumber frame dari file video dengan antarmuka `cv2.VideoCapture`."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._capture = cv2.VideoCapture(str(self.path))
+        if not self._capture.isOpened():
+            raise FileNotFoundError(f"Video tidak dapat dibuka: {self.path}")
+
+    def __len__(self):
+        return max(int(self._capture.get(cv2.CAP_PROP_FRAME_COUNT)), 0)
+
+    def read(self):
+        return self._capture.read()
+
+    def release(self):
+        self._capture.release()
+
+
+class ImageFolderSource:
+    """Sumber frame dari semua gambar di satu folder, urut berdasarkan nama."""
+
+    def __init__(self, path):
+        # Path("") adalah folder kerja, jadi path kosong ditolak lebih dulu
+        if not str(path or "").strip():
+            raise FileNotFoundError("Path folder gambar belum diisi.")
+
+        self.path = Path(path)
+        if not self.path.is_dir():
+            raise FileNotFoundError(f"Folder tidak ditemukan: {self.path}")
+
+        self.files = sorted(
+            file
+            for file in self.path.iterdir()
+            if file.suffix.lower() in IMAGE_SUFFIXES
+        )
+        self._position = 0
+
+    def __len__(self):
+        return len(self.files)
+
+    def read(self):
+        while self._position < len(self.files):
+            frame = cv2.imread(str(self.files[self._position]))
+            self._position += 1
+            if frame is not None:
+                return True, frame
+
+        return False, None
+
+    def release(self):
+        self._position = len(self.files)
+
+
+def open_source(source_type: str, path: str = None):
+    match source_type:
+        case "File Video":
+            return VideoFileSource(path)
+        case "Folder Gambar":
+            return ImageFolderSource(path)
+        case _:
+            return cv2.VideoCapture(0)
@@ -0,0 +1,136 @@
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+WORKER_MAX_BATCH = 8
+
+WORKER_MAX_WAIT_MS = 10
+
+WORKER_METRICS_WINDOW = 200
+
+WORKER_ACTIVE_SECONDS = 1.0
+
+
+@dataclass
+class InferenceRequest:
+    frame: object
+    client: int = field(default_factory=threading.get_ident)
+    future: Future = field(default_factory=Future)
+    submitted_at: float = field(default_factory=time.perf_counter)
+
+
+class SharedInferenceWorker:
+    """Satu thread inferensi untuk semua sesi yang memakai model yang sama.
+
+    Frame dari semua sesi masuk ke satu queue. Worker mengambil frame
+    pertama lalu menunggu paling lama `max_wait_ms` sampai setiap pengirim
+    yang aktif (maksimal `max_batch`) ikut mengirim frame, menjalankan
+    model sekali untuk seluruh batch, dan mengembalikan hasil ke
+    masing-masing pemanggil lewat Future.
+
+    Antarmukanya sama dengan model (`worker(frame, verbose=False)`), jadi
+    bisa dipakai langsung oleh loop serial, `FramePipeline`, atau
+    `GatedModel`.
+    """
+
+    def __init__(
+        self,
+        model,
+        max_batch: int = WORKER_MAX_BATCH,
+        max_wait_ms: float = WORKER_MAX_WAIT_MS,
+    ):
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.frames = 0
+
+        self._requests = queue.Queue()
+        self._clients = {}
+        self._batch_sizes = deque(maxlen=WORKER_METRICS_WINDOW)
+        self._wait_ms = deque(maxlen=WORKER_METRICS_WINDOW)
+        self._thread = threading.Thread(
+            target=self._run, name="shared-inference", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, frame) -> Future:
+        request = InferenceRequest(frame)
+        self._clients[request.client] = request.submitted_at
+        self._requests.put(request)
+        return request.future
+
+    def __call__(self, frame, verbose: bool = False):
+        return [self.submit(frame).result()]
+
+    def active_clients(self) -> int:
+        # Satu thread pengirim per sesi (thread script atau thread pipeline)
+        cutoff = time.perf_counter() - WORKER_ACTIVE_SECONDS
+        for client, last_seen in list(self._clients.items()):
+            if last_seen < cutoff:
+                self._clients.pop(client, None)
+        return len(self._clients)
+
+    def stats(self) -> dict:
+        sizes = list(self._batch_sizes)
+        waits = list(self._wait_ms)
+        return {
+            "queue_depth": self._requests.qsize(),
+            "clients": self.active_clients(),
+            "batches": self.batches,
+            "frames": self.frames,
+            "mean_batch": sum(sizes) / len(sizes) if sizes else 0.0,
+            "max_batch": max(sizes, default=0),
+            "mean_wait_ms": sum(waits) / len(waits) if waits else 0.0,
+        }
+
+    def _collect(self) -> list:
+        batch = [self._requests.get()]
+        deadline = time.perf_counter() + self.max_wait
+
+        # Tidak perlu menunggu frame yang tidak akan datang: satu sesi
+        # aktif langsung diproses dengan batch 1
+        target = min(self.max_batch, max(self.active_clients(), 1))
+
+        while len(batch) < target:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._requests.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+
+            try:
+                results = self.model([r.frame for r in batch], verbose=False)
+            except Exception as err:
+                for request in batch:
+                    request.future.set_exception(err)
+                continue
+
+            for request, result in zip(batch, results):
+                request.future.set_result(result)
+
+            # Future tanpa hasil harus diselesaikan agar pemanggil tidak hang
+            if len(results) != len(batch):
+                err = RuntimeError(
+                    f"Model mengembalikan {len(results)} hasil untuk "
+                    f"{len(batch)} frame"
+                )
+                for request in batch[len(results) :]:
+                    request.future.set_exception(err)
+
+            self.batches += 1
+            self.frames += len(batch)
+            self._batch_sizes.append(len(batch))
+            self._wait_ms.extend((started - r.submitted_at) * 1000 for r in batch)
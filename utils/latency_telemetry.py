@@ -0,0 +1,126 @@
+import threading
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from utils.load_data import OVERALL_COLUMNS, latency_summary
+
+TELEMETRY_STAGES = [
+    "Capture",
+    "Preprocessing",
+    "Inference",
+    "Postprocessing",
+    "Plot",
+    "Render",
+    "End-to-End",
+]
+
+TELEMETRY_WINDOW = 300
+
+TELEMETRY_PERCENTILES = [50, 95, 99]
+
+# Tahap yang membentuk "Total Time (ms)" di Testing-Results CSV
+BENCHMARK_STAGES = ["Preprocessing", "Inference", "Postprocessing"]
+
+
+def speed_timings(speed: dict) -> dict:
+    """Ubah `Results.speed` Ultralytics ke nama tahap telemetri."""
+    return {
+        "Preprocessing": speed.get("preprocess", np.nan),
+        "Inference": speed.get("inference", np.nan),
+        "Postprocessing": speed.get("postprocess", np.nan),
+    }
+
+
+class LatencyTelemetry:
+    """Ring buffer waktu per tahap (ms) untuk `TELEMETRY_WINDOW` frame terakhir.
+
+    Satu baris per frame, satu kolom per tahap di `TELEMETRY_STAGES`. Tahap
+    yang tidak diukur untuk sebuah frame disimpan sebagai NaN.
+    """
+
+    def __init__(self, capacity: int = TELEMETRY_WINDOW):
+        self.capacity = capacity
+        self.frames = 0
+        self._values = np.full((capacity, len(TELEMETRY_STAGES)), np.nan)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.frames, self.capacity)
+
+    def record(self, timings: dict):
+        row = [timings.get(stage, np.nan) for stage in TELEMETRY_STAGES]
+        with self._lock:
+            self._values[self.frames % self.capacity] = row
+            self.frames += 1
+
+    def window(self) -> np.ndarray:
+        """Isi buffer berurutan dari frame terlama ke terbaru."""
+        with self._lock:
+            if self.frames <= self.capacity:
+                return self._values[: self.frames].copy()
+            start = self.frames % self.capacity
+            return np.roll(self._values, -start, axis=0)
+
+    def percentiles(self) -> pd.DataFrame:
+        values = self.window()
+        columns = [f"p{q}" for q in TELEMETRY_PERCENTILES]
+
+        if not len(values):
+            return pd.DataFrame(index=TELEMETRY_STAGES, columns=columns, dtype=float)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            result = np.nanpercentile(values, TELEMETRY_PERCENTILES, axis=0).T
+            mean = np.nanmean(values, axis=0)
+
+        data = pd.DataFrame(result, index=TELEMETRY_STAGES, columns=columns)
+        data.insert(0, "Mean", mean)
+        return data.dropna(how="all").round(2)
+
+    def recent(self, stage: str = "End-to-End") -> pd.DataFrame:
+        values = self.window()[:, TELEMETRY_STAGES.index(stage)]
+        return pd.DataFrame({f"{stage} (ms)": values})
+
+    def overall_frame(self, model: str, size: str = None) -> pd.DataFrame:
+        """Ringkasan jendela saat ini dalam format kolom Testing-Results CSV.
+
+        Kolom akurasi dan training dibiarkan kosong karena tidak diukur
+        oleh demo live. Percentil per tahap ikut ditulis di kolom distribusi
+        latensi.
+        """
+        values = self.window()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mean = dict(zip(TELEMETRY_STAGES, np.nanmean(values, axis=0)))
+
+        total = sum(mean[stage] for stage in BENCHMARK_STAGES)
+
+        row = dict.fromkeys(OVERALL_COLUMNS, np.nan)
+        row.update(
+            {
+                "Index": 1,
+                "Model": model,
+                "Size": size,
+                "Preprocessing (ms)": mean["Preprocessing"],
+                "Inference (ms)": mean["Inference"],
+                "Postprocessing (ms)": mean["Postprocessing"],
+                "Total Time (ms)": total,
+                "FPS": 1000 / total if total else np.nan,
+                "Training Time": None,
+            }
+        )
+
+        samples = pd.DataFrame(
+            {
+                "Model": model,
+                **{
+                    f"{stage} (ms)": values[:, TELEMETRY_STAGES.index(stage)]
+                    for stage in BENCHMARK_STAGES
+                },
+            }
+        )
+
+        data = pd.DataFrame([row], columns=OVERALL_COLUMNS).round(4)
+        return data.merge(latency_summary(samples), on="Model", how="left")
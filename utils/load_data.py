@@ -1,20 +1,207 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from utils.columnar_cache import read_csv_cached
+from utils.metric_cube import MetricCube
+from utils.model_catalog import VARIANT_GROUPS, ModelCatalog
+
+OVERALL_DTYPES = {
+    "Model": str,
+    "Precision": "float64",
+    "Recall": "float64",
+    "F1-Score": "float64",
+    "mAP50": "float64",
+    "mAP50-95": "float64",
+    "Preprocessing (ms)": "float64",
+    "Inference (ms)": "float64",
+    "Postprocessing (ms)": "float64",
+    "Total Time (ms)": "float64",
+    "FPS": "float64",
+    "Parameters (M)": "float64",
+    "Training Time": str,
+}
+
+OVERALL_COLUMNS = [
+    "Index",
+    "Model",
+    "Size",
+    "Precision",
+    "Recall",
+    "F1-Score",
+    "mAP50",
+    "mAP50-95",
+    "Preprocessing (ms)",
+    "Inference (ms)",
+    "Postprocessing (ms)",
+    "Total Time (ms)",
+    "FPS",
+    "Parameters (M)",
+    "Training Time",
+]
+
+# Kolom distribusi latensi opsional, misalnya "Total Time p99 (ms)"
+LATENCY_STAGES = ["Preprocessing", "Inference", "Postprocessing", "Total Time"]
+
+LATENCY_PERCENTILES = [50, 95, 99]
+
+LATENCY_STATISTICS = [f"p{q}" for q in LATENCY_PERCENTILES] + ["Std"]
+
+
+def latency_column(stage: str, statistic: str) -> str:
+    return f"{stage} {statistic} (ms)"
+
+
+LATENCY_COLUMNS = [
+    latency_column(stage, statistic)
+    for stage in LATENCY_STAGES
+    for statistic in LATENCY_STATISTICS
+]
+
+OVERALL_DTYPES.update(dict.fromkeys(LATENCY_COLUMNS, "float64"))
+
+OVERALL_RESULTS_FILE = "Testing-Results-LAST_ASLI.csv"
+
+# Hasil reports.cpu_benchmark; dipakai menggantikan OVERALL_RESULTS_FILE
+# selama tidak lebih lama dari file tersebut
+BENCHMARK_RESULTS_FILE = "Testing-Results-BENCHMARK.csv"
+
+# Waktu per gambar: satu baris per gambar per trial
+LATENCY_SAMPLES_FILE = "Testing-Latency-Samples.csv"
+
+LATENCY_SAMPLE_DTYPES = {
+    "Model": str,
+    "Preprocessing (ms)": "float64",
+    "Inference (ms)": "float64",
+    "Postprocessing (ms)": "float64",
+}
+
+# Hasil sweep konfigurasi CPU: satu baris per model × konfigurasi
+SWEEP_RESULTS_FILE = "Testing-Sweep-Results.csv"
+
+SWEEP_PARAMETERS = ["Batch Size", "Image Size", "Threads"]
+
+SWEEP_METRICS = ["Throughput (FPS)", "Latency (ms)", "Latency p95 (ms)"]
+
+SWEEP_DTYPES = {
+    "Model": str,
+    "Batch Size": "int32",
+    "Image Size": "int32",
+    "Threads": "int32",
+    **dict.fromkeys(SWEEP_METRICS, "float64"),
+}
+
+# Profil footprint: satu baris per model × backend
+FOOTPRINT_RESULTS_FILE = "Testing-Footprint-Results.csv"
+
+FOOTPRINT_METRICS = [
+    "Load Time (s)",
+    "First Inference (ms)",
+    "Peak RSS First (MB)",
+    "Peak RSS Steady (MB)",
+]
+
+FOOTPRINT_DTYPES = {
+    "Model": str,
+    "Backend": str,
+    "Disk Size (MB)": "float64",
+    **dict.fromkeys(FOOTPRINT_METRICS, "float64"),
+    "Peak RSS Reset": "boolean",
+}
+
+# Metrik runtime di tabel utama diambil dari backend yang sama dengan
+# kolom latency; ukuran file ditampilkan untuk setiap backend
+FOOTPRINT_BACKEND = "PyTorch"
+
+CLASS_DTYPES = {
+    "Model": str,
+    "Class": str,
+    "Precision": "float64",
+    "Recall": "float64",
+    "F1-Score": "float64",
+    "mAP50": "float64",
+    "mAP50-95": "float64",
+}
+
+TRAINING_LOG_PREFIXES = ("metrics/", "train/", "val/", "lr/")
+
+TRAINING_LOG_WORKERS = 8
+
+MODEL_DERIVED_COLUMNS = ["family", "variant", "size_code"]
+
+DERIVED_COLUMNS = ["training_seconds"] + MODEL_DERIVED_COLUMNS
+
+
+def overall_results_path(dataset_dir: Path) -> Path:
+    """Testing-Results CSV yang ditampilkan: hasil benchmark jika lebih baru."""
+    overall_path = dataset_dir / OVERALL_RESULTS_FILE
+    benchmark_path = dataset_dir / BENCHMARK_RESULTS_FILE
+
+    if not benchmark_path.exists():
+        return overall_path
+    if overall_path.exists() and (
+        overall_path.stat().st_mtime > benchmark_path.stat().st_mtime
+    ):
+        return overall_path
+    return benchmark_path
+
+
+def metadata_path(path: Path) -> Path:
+    """File `.meta.json` yang ditulis runner benchmark di sebelah CSV-nya."""
+    return path.with_name(f"{path.stem}.meta.json")
+
+
+def same_benchmark_run(results_path: Path, samples_path: Path) -> bool:
+    """True jika kedua file berasal dari run benchmark yang sama.
+
+    Testing-Results CSV tanpa metadata (misalnya hasil asli) tidak pernah
+    dianggap cocok, karena percentil dari mesin lain tidak sebanding
+    dengan rata-ratanya.
+    """
+    try:
+        with open(metadata_path(results_path)) as f:
+            results_meta = json.load(f)
+        with open(metadata_path(samples_path)) as f:
+            samples_meta = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    return results_meta == samples_meta
+
 
 @st.cache_data
 def load_main_data(dataset: str):
     base_dir = Path(__file__).resolve().parent.parent
 
-    overall_path = base_dir / "data" / dataset / "Testing-Results-LAST_ASLI.csv"
+    overall_path = overall_results_path(base_dir / "data" / dataset)
     all_class_path = base_dir / "data" / dataset / "yolo_metrics_detailed.csv"
+    samples_path = base_dir / "data" / dataset / LATENCY_SAMPLES_FILE
+    footprint_path = base_dir / "data" / dataset / FOOTPRINT_RESULTS_FILE
 
     try:
-        df_overall = pd.read_csv(overall_path)
-        df_all_class = pd.read_csv(all_class_path)
+        df_overall = read_csv_cached(overall_path, OVERALL_DTYPES)
+        df_all_class = read_csv_cached(all_class_path, CLASS_DTYPES)
+
+        if samples_path.exists() and same_benchmark_run(overall_path, samples_path):
+            samples = read_csv_cached(samples_path, LATENCY_SAMPLE_DTYPES)
+            df_overall = add_latency_columns(df_overall, samples)
+
+        if footprint_path.exists():
+            footprint = read_csv_cached(footprint_path, FOOTPRINT_DTYPES)
+            df_overall = add_footprint_columns(df_overall, footprint)
+
+        df_overall = add_model_columns(df_overall)
+        df_overall["training_seconds"] = pd.to_timedelta(
+            df_overall["Training Time"]
+        ).dt.total_seconds()
+
+        class_catalog = ModelCatalog.from_names(df_all_class["Model"].unique())
+        df_all_class["Model"] = df_all_class["Model"].astype(class_catalog.dtype)
 
         return df_overall, df_all_class
 
@@ -23,6 +210,116 @@ def load_main_data(dataset: str):
         return None, None
 
 
+def latency_summary(samples: pd.DataFrame) -> pd.DataFrame:
+    """Percentil dan standar deviasi latensi per model dari waktu per gambar.
+
+    Total Time dihitung per gambar, bukan dari jumlah percentil per tahap.
+    """
+    stage_cols = [f"{stage} (ms)" for stage in LATENCY_STAGES[:-1]]
+    times = samples[["Model"] + stage_cols].copy()
+    times["Total Time (ms)"] = times[stage_cols].sum(axis=1, skipna=False)
+
+    grouped = times.groupby("Model", sort=False, observed=True)
+    quantiles = [q / 100 for q in LATENCY_PERCENTILES]
+
+    summary = {}
+    for stage in LATENCY_STAGES:
+        values = grouped[f"{stage} (ms)"]
+        per_quantile = values.quantile(quantiles).unstack().reindex(columns=quantiles)
+        for q, quantile in zip(LATENCY_PERCENTILES, quantiles):
+            summary[latency_column(stage, f"p{q}")] = per_quantile[quantile]
+        summary[latency_column(stage, "Std")] = values.std()
+
+    return pd.DataFrame(summary, columns=LATENCY_COLUMNS).round(4).reset_index()
+
+
+def add_latency_columns(overall: pd.DataFrame, samples: pd.DataFrame):
+    """Lengkapi kolom distribusi latensi dari file waktu per gambar.
+
+    Nilai yang sudah ada di Testing-Results CSV tidak ditimpa.
+    """
+    summary = latency_summary(samples).set_index("Model")
+    summary = summary.reindex(overall["Model"].astype(str))
+
+    for col in LATENCY_COLUMNS:
+        values = pd.Series(summary[col].to_numpy(), index=overall.index)
+        overall[col] = overall[col].fillna(values) if col in overall else values
+
+    return overall
+
+
+def disk_size_column(backend: str) -> str:
+    return f"Disk Size {backend} (MB)"
+
+
+def add_footprint_columns(overall: pd.DataFrame, footprint: pd.DataFrame):
+    """Gabungkan hasil profil footprint ke tabel utama per model.
+
+    Nama model dicocokkan lewat kode ModelCatalog, jadi "yolov8N" dari
+    nama checkpoint tetap bertemu "YOLOv8n" di Testing-Results CSV.
+    """
+    catalog = ModelCatalog.from_names(overall["Model"].dropna().unique())
+    models = catalog.codes(overall["Model"])
+    footprint = footprint.assign(code=catalog.codes(footprint["Model"]))
+    footprint = footprint[footprint["code"] >= 0]
+
+    runtime = footprint[footprint["Backend"] == FOOTPRINT_BACKEND]
+    runtime = runtime.drop_duplicates("code", keep="last").set_index("code")
+    for col in FOOTPRINT_METRICS:
+        overall[col] = runtime[col].reindex(models).to_numpy()
+
+    disk = footprint.pivot_table(
+        index="code", columns="Backend", values="Disk Size (MB)", aggfunc="last"
+    )
+    for backend in disk.columns:
+        overall[disk_size_column(backend)] = disk[backend].reindex(models).to_numpy()
+
+    return overall
+
+
+def footprint_columns(data: pd.DataFrame) -> list:
+    """Kolom footprint yang terisi di `data`, metrik runtime lalu ukuran file."""
+    columns = FOOTPRINT_METRICS + [
+        col for col in data.columns if col.startswith("Disk Size ")
+    ]
+    return [col for col in columns if col in data and data[col].notna().any()]
+
+
+def latency_columns(data: pd.DataFrame, stage: str = "Total Time") -> list:
+    """Kolom distribusi latensi `stage` yang terisi di `data`."""
+    columns = [latency_column(stage, statistic) for statistic in LATENCY_STATISTICS]
+    return [col for col in columns if col in data and data[col].notna().any()]
+
+
+@st.cache_resource
+def load_metric_cube(dataset: str) -> Optional[MetricCube]:
+    _, df_all_class = load_main_data(dataset)
+
+    if df_all_class is None:
+        return None
+
+    return MetricCube.from_frame(df_all_class)
+
+
+@st.cache_data
+def load_sweep_data(dataset: str) -> Optional[pd.DataFrame]:
+    base_dir = Path(__file__).resolve().parent.parent
+    sweep_path = base_dir / "data" / dataset / SWEEP_RESULTS_FILE
+
+    if not sweep_path.exists():
+        return None
+
+    try:
+        data = read_csv_cached(sweep_path, SWEEP_DTYPES)
+        catalog = ModelCatalog.from_names(data["Model"].unique())
+        data["Model"] = data["Model"].astype(catalog.dtype)
+        return data
+
+    except Exception as err:
+        st.error(f"Gagal memuat hasil sweep: {err}")
+        return None
+
+
 @st.cache_data
 def load_logo():
     base_dir = Path(__file__).resolve().parent.parent
@@ -32,56 +329,81 @@ def load_logo():
     return logo_path
 
 
+def training_log_dtypes(columns: list) -> dict:
+    dtype = {}
+    for col in columns:
+        if col == "epoch":
+            dtype[col] = "int32"
+        elif col == "time" or col.startswith(TRAINING_LOG_PREFIXES):
+            dtype[col] = "float32"
+    return dtype
+
+
+def read_training_log(file_path: Path) -> pd.DataFrame:
+    # Header Ultralytics diberi spasi di depan, jadi nama kolom dibersihkan
+    # dari baris header dan langsung dipakai saat parsing.
+    with open(file_path, "r", encoding="utf-8") as f:
+        columns = [col.strip() for col in f.readline().rstrip("\r\n").split(",")]
+
+    return read_csv_cached(file_path, training_log_dtypes(columns), names=columns)
+
+
+def combine_training_logs(frames: list, model_names: list) -> pd.DataFrame:
+    data = pd.concat(frames, ignore_index=True, copy=False)
+
+    model_codes = np.repeat(
+        np.arange(len(frames), dtype=np.int32), [len(frame) for frame in frames]
+    )
+    data["Model"] = pd.Categorical.from_codes(model_codes, categories=model_names)
+
+    return add_model_columns(data)
+
+
+def _expand_per_model(per_model: pd.Series, codes: np.ndarray, categories=None):
+    if categories is None:
+        categories = sorted(per_model.dropna().unique())
+
+    lookup = pd.Index(categories).get_indexer(per_model)
+    expanded = np.where(codes >= 0, lookup[codes], -1)
+
+    return pd.Categorical.from_codes(expanded, categories=categories)
+
+
+def add_model_columns(data: pd.DataFrame) -> pd.DataFrame:
+    # Atribut model dihitung sekali per nama model lewat katalog, lalu
+    # disebar ke semua baris lewat kode katalognya.
+    catalog = ModelCatalog.from_names(data["Model"].dropna().unique())
+    codes = catalog.codes(data["Model"])
+
+    infos = pd.DataFrame(catalog.models)
+
+    data["Model"] = data["Model"].astype(catalog.dtype)
+    data["family"] = _expand_per_model(infos["family"], codes, catalog.families)
+    data["variant"] = _expand_per_model(infos["variant"], codes, VARIANT_GROUPS)
+    data["size_code"] = _expand_per_model(infos["size_code"], codes)
+
+    return data
+
+
 @st.cache_data
 def load_training_logs(dataset: str) -> Optional[pd.DataFrame]:
     base_dir = Path(__file__).resolve().parent.parent
     data_path = base_dir / "data" / dataset
 
-    csv_files = list(data_path.glob("*_results.csv"))
+    csv_files = sorted(data_path.glob("*_results.csv"))
 
-    combined_data = []
     try:
         if not csv_files:
             return None
 
-        for file_path in csv_files:
-            model_name_clean = file_path.name.replace("_results.csv", "")
-            curr_variant = get_variant_group(model_name_clean)
-
-            data = pd.read_csv(file_path)
-            data.columns = data.columns.str.strip()
-
-            data["Model"] = model_name_clean
-            data["Variant_Group"] = curr_variant
+        workers = min(TRAINING_LOG_WORKERS, len(csv_files))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            frames = list(pool.map(read_training_log, csv_files))
 
-            combined_data.append(data)
+        model_names = [f.name.replace("_results.csv", "") for f in csv_files]
 
-        if combined_data:
-            return pd.concat(combined_data, ignore_index=True)
-        else:
-            return None
+        return combine_training_logs(frames, model_names)
 
     except Exception as err:
         st.error(f"Gagal memuat log training: {err}")
         return None
-
-
-def get_variant_group(model_name: str):
-    if not model_name:
-        return "Lainnya"
-
-    variant_char = model_name[-1].lower()
-
-    if variant_char in ["n", "t"]:
-        return "Nano & Tiny (n/t)"
-    elif variant_char == "s":
-        return "Small (s)"
-    elif variant_char == "m":
-        return "Medium (m)"
-    elif variant_char in ["l", "c"]:
-        return "Large & Compact (l/c)"
-    else:
-        return "Lainnya"
-        return "Lainnya"
-        return "Lainnya"
-        return "Lainnya"
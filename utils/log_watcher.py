@@ -0,0 +1,206 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import streamlit as st
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+from utils.load_data import (
+    MODEL_DERIVED_COLUMNS,
+    TRAINING_LOG_WORKERS,
+    add_model_columns,
+    training_log_dtypes,
+)
+
+RESULTS_SUFFIX = "_results.csv"
+
+# Awal file yang diingat untuk mendeteksi file yang ditulis ulang
+TAIL_SIGNATURE_BYTES = 4096
+
+
+@dataclass
+class TailState:
+    offset: int = 0
+    rows: int = 0
+    columns: list = field(default_factory=list)
+    inode: int = 0
+    signature: bytes = b""
+
+
+class _ResultsEventHandler(FileSystemEventHandler):
+    def __init__(self, tail: "TrainingLogTail"):
+        self.tail = tail
+
+    def on_created(self, event):
+        self.tail.mark_dirty(event.src_path)
+
+    def on_modified(self, event):
+        self.tail.mark_dirty(event.src_path)
+
+    def on_moved(self, event):
+        self.tail.mark_dirty(event.src_path)
+        self.tail.mark_dirty(event.dest_path)
+
+    def on_deleted(self, event):
+        self.tail.mark_dirty(event.src_path)
+
+
+class TrainingLogTail:
+    """Versi inkremental dari `load_training_logs` untuk training yang masih jalan.
+
+    Setiap file `*_results.csv` diingat offset byte dan jumlah barisnya.
+    Watchdog menandai file yang berubah, lalu `refresh()` hanya mem-parsing
+    baris baru dan menggabungkannya ke frame di memori.
+    """
+
+    def __init__(self, data_path: Path):
+        self.data_path = data_path
+        self.version = 0
+        self._states = {}
+        self._data = None
+        self._dirty = set(data_path.glob(f"*{RESULTS_SUFFIX}"))
+        self._dirty_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+        self._observer = Observer()
+        self._observer.schedule(
+            _ResultsEventHandler(self), str(data_path), recursive=False
+        )
+        self._observer.daemon = True
+        self._observer.start()
+
+    def mark_dirty(self, path):
+        path = Path(path)
+        if path.name.endswith(RESULTS_SUFFIX):
+            with self._dirty_lock:
+                self._dirty.add(path)
+
+    def stop(self):
+        self._observer.stop()
+
+    def refresh(self) -> Optional[pd.DataFrame]:
+        with self._refresh_lock:
+            with self._dirty_lock:
+                dirty = sorted(self._dirty)
+                self._dirty = set()
+
+            if dirty:
+                workers = min(TRAINING_LOG_WORKERS, len(dirty))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    chunks = list(pool.map(self._read_appended, dirty))
+
+                for path, (reset, chunk) in zip(dirty, chunks):
+                    self._merge(path, reset, chunk)
+
+            if self._data is None:
+                return None
+
+            # Salinan dangkal: halaman boleh menambah kolom tanpa mengubah
+            # frame bersama milik semua sesi.
+            return self._data.copy(deep=False)
+
+    def _read_appended(self, path: Path):
+        state = self._states.get(path)
+
+        if not path.exists():
+            return True, None
+
+        stat = path.stat()
+
+        with open(path, "rb") as f:
+            # Training yang di-restart menulis ulang file dari awal; file baru
+            # bisa saja sudah lebih panjang dari offset lama, jadi awal file
+            # dibandingkan dengan yang sudah dibaca sebelumnya.
+            reset = (
+                state is None
+                or stat.st_size < state.offset
+                or stat.st_ino != state.inode
+                or f.read(len(state.signature)) != state.signature
+            )
+            if reset:
+                state = TailState(inode=stat.st_ino)
+
+            f.seek(state.offset)
+            raw = f.read()
+
+            # Baris terakhir bisa saja belum selesai ditulis oleh proses training.
+            end = raw.rfind(b"\n") + 1
+            raw = raw[:end]
+            offset = state.offset + end
+
+            if len(state.signature) < min(offset, TAIL_SIGNATURE_BYTES):
+                f.seek(0)
+                state.signature = f.read(min(offset, TAIL_SIGNATURE_BYTES))
+
+        if not state.columns:
+            header_end = raw.find(b"\n") + 1
+            if header_end == 0:
+                return reset, None
+            header = raw[:header_end].decode("utf-8").rstrip("\r\n")
+            state.columns = [col.strip() for col in header.split(",")]
+            raw = raw[header_end:]
+
+        state.offset = offset
+        self._states[path] = state
+
+        if not raw:
+            return reset, None
+
+        chunk = pd.read_csv(
+            io.BytesIO(raw),
+            header=None,
+            names=state.columns,
+            dtype=training_log_dtypes(state.columns),
+        )
+        state.rows += len(chunk)
+
+        return reset, chunk
+
+    def _merge(self, path: Path, reset: bool, chunk: Optional[pd.DataFrame]):
+        model_name = path.name.replace(RESULTS_SUFFIX, "")
+
+        if reset and self._data is not None:
+            self._data = self._data[self._data["Model"] != model_name]
+            if not path.exists():
+                self._states.pop(path, None)
+
+        if chunk is None or chunk.empty:
+            if reset:
+                self.version += 1
+            return
+
+        if self._data is None:
+            models = [model_name]
+        else:
+            models = list(self._data["Model"].cat.categories)
+            if model_name not in models:
+                models.append(model_name)
+
+        chunk["Model"] = pd.Categorical(
+            [model_name] * len(chunk), dtype=pd.CategoricalDtype(models)
+        )
+
+        if self._data is not None and not self._data.empty:
+            data = self._data.drop(columns=MODEL_DERIVED_COLUMNS)
+            data["Model"] = data["Model"].cat.set_categories(models)
+            chunk = pd.concat([data, chunk], ignore_index=True)
+
+        self._data = add_model_columns(chunk)
+
+        self.version += 1
+
+
+@st.cache_resource
+def get_training_log_tail(dataset: str) -> Optional[TrainingLogTail]:
+    base_dir = Path(__file__).resolve().parent.parent
+    data_path = base_dir / "data" / dataset
+
+    if not data_path.is_dir():
+        return None
+
+    return TrainingLogTail(data_path)
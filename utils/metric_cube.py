@@ -0,0 +1,81 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+CLASS_METRICS = ["Precision", "Recall", "F1-Score", "mAP50", "mAP50-95"]
+
+
+class MetricCube:
+    """Data per kelas dalam array padat model × kelas × metrik.
+
+    Dibangun sekali dari `yolo_metrics_detailed.csv`; tampilan per kelas
+    cukup mengambil irisan array alih-alih melakukan pivot ulang.
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        models: pd.Index,
+        classes: pd.Index,
+        metrics: pd.Index,
+    ):
+        values.flags.writeable = False
+
+        self.values = values
+        self.models = models
+        self.classes = classes
+        self.metrics = metrics
+
+    @classmethod
+    def from_frame(cls, class_data: pd.DataFrame, metrics=None) -> "MetricCube":
+        metrics = [m for m in (metrics or CLASS_METRICS) if m in class_data.columns]
+
+        model = class_data["Model"].astype("category")
+        models = pd.Index(model.cat.categories.astype(str), name="Model")
+        # Kelas diurutkan alfabetis, sama seperti kolom hasil pivot_table
+        classes = pd.Index(
+            np.sort(class_data["Class"].dropna().unique()), name="Class"
+        )
+
+        model_idx = model.cat.codes.to_numpy(dtype=np.int64)
+        class_idx = classes.get_indexer(class_data["Class"])
+        keep = (model_idx >= 0) & (class_idx >= 0)
+
+        # Baris (model, kelas) ganda dirata-rata seperti pivot_table,
+        # dengan NaN diabaikan
+        cells = model_idx[keep] * len(classes) + class_idx[keep]
+        rows = class_data[metrics].to_numpy(dtype=float)[keep]
+        valid = ~np.isnan(rows)
+
+        sums = np.zeros((len(models) * len(classes), len(metrics)))
+        counts = np.zeros_like(sums)
+        np.add.at(sums, cells, np.where(valid, rows, 0.0))
+        np.add.at(counts, cells, valid)
+
+        with np.errstate(invalid="ignore"):
+            values = (sums / counts).reshape(len(models), len(classes), len(metrics))
+
+        return cls(values, models, classes, pd.Index(metrics, name="Metrics"))
+
+    def __len__(self):
+        return len(self.models)
+
+    def subset(self, models) -> "MetricCube":
+        if not len(models):
+            return self
+
+        wanted = set(map(str, models))
+        rows = np.flatnonzero(self.models.isin(wanted))
+
+        return MetricCube(
+            self.values[rows], self.models[rows], self.classes, self.metrics
+        )
+
+    def frame(self, metric: str, models: Optional[list] = None) -> pd.DataFrame:
+        cube = self.subset(models) if models is not None else self
+        k = cube.metrics.get_loc(metric)
+
+        return pd.DataFrame(
+            cube.values[:, :, k], index=cube.models, columns=cube.classes, copy=False
+        )
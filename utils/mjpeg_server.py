@@ -0,0 +1,125 @@
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import streamlit as st
+
+# Server tanpa autentikasi: default hanya localhost, set MJPEG_HOST=0.0.0.0
+# untuk penonton jarak jauh
+MJPEG_HOST = os.environ.get("MJPEG_HOST", "127.0.0.1")
+
+MJPEG_PORT = int(os.environ.get("MJPEG_PORT", 8502))
+
+# URL dasar stream bila server MJPEG berada di balik reverse proxy,
+# misalnya https://example.com/mjpeg
+MJPEG_PUBLIC_URL = os.environ.get("MJPEG_PUBLIC_URL", "").rstrip("/")
+
+MJPEG_BOUNDARY = "frame"
+
+# Koneksi ditutup jika stream tidak mengirim frame selama ini (detik)
+MJPEG_IDLE_SECONDS = 10
+
+STREAM_PATH = re.compile(r"^/stream/([\w-]+)\.mjpg$")
+
+
+class FrameBroadcaster:
+    """Simpan JPEG terbaru per stream dan bangunkan penonton saat frame baru tiba.
+
+    Setiap penonton membaca frame terbaru dengan kecepatannya sendiri;
+    frame yang terlewat tidak pernah dikirim.
+    """
+
+    def __init__(self):
+        self._frames = {}
+        self._condition = threading.Condition()
+
+    def publish(self, stream_id: str, jpeg: bytes):
+        with self._condition:
+            version = self._frames.get(stream_id, (0, None))[0] + 1
+            self._frames[stream_id] = (version, jpeg)
+            self._condition.notify_all()
+
+    def wait(self, stream_id: str, after: int, timeout: float):
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._frames.get(stream_id, (0, None))[0] > after, timeout
+            )
+            item = self._frames.get(stream_id)
+            if item is None or item[0] <= after:
+                return None
+            return item
+
+    def close(self, stream_id: str):
+        with self._condition:
+            self._frames.pop(stream_id, None)
+
+
+class _MjpegHandler(BaseHTTPRequestHandler):
+    broadcaster: FrameBroadcaster = None
+
+    def do_GET(self):
+        match = STREAM_PATH.match(urlsplit(self.path).path)
+        if match is None:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header(
+            "Content-Type", f"multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}"
+        )
+        self.send_header("Cache-Control", "no-cache, no-store")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        stream_id = match.group(1)
+        version = 0
+
+        try:
+            while True:
+                item = self.broadcaster.wait(stream_id, version, MJPEG_IDLE_SECONDS)
+                if item is None:
+                    return
+
+                version, jpeg = item
+                self.wfile.write(
+                    f"--{MJPEG_BOUNDARY}\r\n"
+                    "Content-Type: image/jpeg\r\n"
+                    f"Content-Length: {len(jpeg)}\r\n\r\n".encode()
+                )
+                self.wfile.write(jpeg)
+                self.wfile.write(b"\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+    def log_message(self, format, *args):
+        pass
+
+
+@st.cache_resource
+def get_mjpeg_server(port: int = MJPEG_PORT):
+    """Jalankan server MJPEG sekali per proses dan kembalikan broadcaster-nya."""
+    broadcaster = FrameBroadcaster()
+    handler = type("MjpegHandler", (_MjpegHandler,), {"broadcaster": broadcaster})
+
+    server = ThreadingHTTPServer((MJPEG_HOST, port), handler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="mjpeg-server", daemon=True
+    ).start()
+
+    return broadcaster
+
+
+def stream_url(stream_id: str, run: int, port: int = MJPEG_PORT) -> str:
+    path = f"/stream/{stream_id}.mjpg?run={run}"
+    if MJPEG_PUBLIC_URL:
+        return f"{MJPEG_PUBLIC_URL}{path}"
+
+    # Scheme dan host diambil dari request browser, jadi halaman HTTPS
+    # tidak memuat stream http:// (mixed content)
+    headers = st.context.headers
+    scheme = headers.get("X-Forwarded-Proto") or urlsplit(st.context.url or "").scheme
+    host = headers.get("Host", "localhost").rsplit(":", 1)[0]
+    return f"{scheme or 'http'}://{host}:{port}{path}"
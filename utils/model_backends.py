@@ -0,0 +1,175 @@
+import hashlib
+import importlib.util
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from ultralytics import YOLO
+
+from utils.latency_telemetry import BENCHMARK_STAGES, speed_timings
+
+MODELS_DIR = Path("models")
+
+# Backend → (format export Ultralytics, paket runtime yang dibutuhkan)
+MODEL_BACKENDS = {
+    "PyTorch": (None, "torch"),
+    "ONNX Runtime": ("onnx", "onnxruntime"),
+    "OpenVINO": ("openvino", "openvino"),
+}
+
+BENCHMARK_WARMUP = 2
+
+_export_lock = threading.Lock()
+
+
+def available_backends() -> list:
+    # Ultralytics mencoba meng-install paket yang hilang saat export,
+    # jadi backend tanpa runtime terpasang tidak ditawarkan sama sekali
+    return [
+        name
+        for name, (_, package) in MODEL_BACKENDS.items()
+        if importlib.util.find_spec(package) is not None
+    ]
+
+
+def checkpoint_hash(path: Path) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+def checkpoint_size(checkpoint: Path):
+    if not checkpoint.exists():
+        return None
+    return f"{checkpoint.stat().st_size / 1024 ** 2:.1f} MB"
+
+
+def artifact_megabytes(path: Path) -> float:
+    # Export OpenVINO berupa folder (.xml + .bin)
+    if path.is_dir():
+        size = sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+    else:
+        size = path.stat().st_size
+    return size / 1024**2
+
+
+def exported_path(checkpoint: Path, fmt: str) -> Path:
+    # Penanda .dynamic membuat artefak shape statis lama ikut dihapus _drop_stale
+    stem = f"{checkpoint.stem}.{checkpoint_hash(checkpoint)}.dynamic"
+    if fmt == "openvino":
+        return checkpoint.with_name(f"{stem}_openvino_model")
+    return checkpoint.with_name(f"{stem}.{fmt}")
+
+
+def _drop_stale(checkpoint: Path, fmt: str, keep: Path):
+    pattern = (
+        f"{checkpoint.stem}.*_openvino_model"
+        if fmt == "openvino"
+        else f"{checkpoint.stem}.*.{fmt}"
+    )
+    for stale in checkpoint.parent.glob(pattern):
+        if stale == keep:
+            continue
+        if stale.is_dir():
+            shutil.rmtree(stale, ignore_errors=True)
+        else:
+            stale.unlink(missing_ok=True)
+
+
+def export_checkpoint(checkpoint: Path, fmt: str) -> Path:
+    """Export checkpoint `.pt` sekali dan simpan di sebelahnya.
+
+    Nama artefak memuat hash isi checkpoint, jadi checkpoint yang diganti
+    otomatis di-export ulang dan artefak lama dihapus. Export memakai batch
+    dinamis, sehingga artefak menerima beberapa frame sekaligus.
+    """
+    target = exported_path(checkpoint, fmt)
+
+    with _export_lock:
+        if target.exists():
+            return target
+
+        # Shape input dinamis: batch dan ukuran gambar tidak terkunci di
+        # 1×640, jadi artefak bisa dipakai batch_demo dan shared worker
+        exported = Path(YOLO(str(checkpoint)).export(format=fmt, dynamic=True))
+        os.replace(exported, target)
+        _drop_stale(checkpoint, fmt, target)
+
+    return target
+
+
+def backend_artifact(model_name: str, backend: str) -> Path:
+    """File yang dimuat backend: checkpoint `.pt` atau hasil export-nya."""
+    checkpoint = MODELS_DIR / model_name
+    fmt, _ = MODEL_BACKENDS[backend]
+
+    if fmt is None:
+        return checkpoint
+
+    return export_checkpoint(checkpoint, fmt)
+
+
+def load_artifact(artifact: Path, backend: str):
+    """Muat artefak yang sudah di-resolve, tanpa export atau hash checkpoint."""
+    if MODEL_BACKENDS[backend][0] is None:
+        return YOLO(str(artifact))
+
+    return YOLO(str(artifact), task="detect")
+
+
+def load_backend_model(model_name: str, backend: str):
+    return load_artifact(backend_artifact(model_name, backend), backend)
+
+
+def collect_frames(source, count: int) -> list:
+    frames = []
+    while len(frames) < count:
+        ret, frame = source.read()
+        if not ret:
+            break
+        frames.append(frame)
+    return frames
+
+
+def benchmark_backends(models: dict, frames: list) -> pd.DataFrame:
+    """Ukur setiap backend pada frame yang sama, satu frame per panggilan.
+
+    Hasilnya memakai nama kolom waktu dari Testing-Results CSV.
+    """
+    rows = []
+
+    for backend, model in models.items():
+        for frame in frames[:BENCHMARK_WARMUP]:
+            model(frame, verbose=False)
+
+        timings = []
+        start = time.perf_counter()
+        for frame in frames:
+            result = model(frame, verbose=False)[0]
+            timings.append(speed_timings(result.speed))
+        elapsed = time.perf_counter() - start
+
+        mean = pd.DataFrame(timings)[BENCHMARK_STAGES].mean()
+        rows.append(
+            {
+                "Backend": backend,
+                "Preprocessing (ms)": mean["Preprocessing"],
+                "Inference (ms)": mean["Inference"],
+                "Postprocessing (ms)": mean["Postprocessing"],
+                "Total Time (ms)": mean.sum(),
+                "FPS": len(frames) / elapsed if elapsed else np.nan,
+            }
+        )
+
+    data = pd.DataFrame(rows)
+    if "PyTorch" in models:
+        baseline = data.loc[data["Backend"] == "PyTorch", "Total Time (ms)"].iloc[0]
+        data["Speed-up"] = baseline / data["Total Time (ms)"]
+
+    return data.round(4)
@@ -0,0 +1,129 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+MODEL_PATTERN = re.compile(r"^(yolov(\d+))([a-z]*)$", re.IGNORECASE)
+
+CHECKPOINT_PATTERN = re.compile(r"yolov\d+[a-z]*", re.IGNORECASE)
+
+# n/t dan l/c berada di peringkat yang sama, sesuai pengelompokan varian.
+SIZE_RANK = {"n": 0, "t": 0, "s": 1, "m": 2, "c": 3, "l": 3, "x": 4}
+
+VARIANT_GROUPS = [
+    "Nano & Tiny (n/t)",
+    "Small (s)",
+    "Medium (m)",
+    "Large & Compact (l/c)",
+    "Lainnya",
+]
+
+
+def get_variant_group(model_name: str):
+    if not model_name:
+        return "Lainnya"
+
+    variant_char = model_name[-1].lower()
+
+    if variant_char in ["n", "t"]:
+        return "Nano & Tiny (n/t)"
+    elif variant_char == "s":
+        return "Small (s)"
+    elif variant_char == "m":
+        return "Medium (m)"
+    elif variant_char in ["l", "c"]:
+        return "Large & Compact (l/c)"
+    else:
+        return "Lainnya"
+
+
+def checkpoint_model_name(file_name: str) -> str:
+    """Nama model dari nama file checkpoint, misalnya "best-YOLOv11s-Roboflow.pt"."""
+    match = CHECKPOINT_PATTERN.search(file_name)
+    if match is None:
+        return file_name
+    return "YOLO" + match.group(0)[4:]
+
+
+@dataclass(frozen=True)
+class ModelInfo:
+    name: str
+    family: Optional[str]
+    version: float
+    size_code: str
+    variant: str
+
+    @property
+    def rank(self):
+        size_rank = SIZE_RANK.get(self.size_code, len(SIZE_RANK))
+        return (self.version, size_rank, self.name)
+
+
+def parse_model_name(name: str) -> ModelInfo:
+    match = MODEL_PATTERN.match(name.strip())
+
+    if match is None:
+        return ModelInfo(name, None, np.inf, name[-1:].lower(), get_variant_group(name))
+
+    family, version, size_code = match.groups()
+    return ModelInfo(
+        name=name,
+        family=family.lower(),
+        version=int(version),
+        size_code=size_code.lower(),
+        variant=get_variant_group(name),
+    )
+
+
+class ModelCatalog:
+    """Urutan kanonik model YOLO yang dibangun dari nama model di data.
+
+    Urutan default adalah versi lalu ukuran (n/t, s, m, l/c, x), sehingga
+    versi baru seperti YOLOv13 langsung ikut terurut tanpa mengubah kode.
+    """
+
+    def __init__(self, names):
+        infos = {parse_model_name(str(name)) for name in names}
+        infos = sorted(infos, key=lambda info: info.rank)
+
+        self.models = infos
+        self.order = [info.name for info in infos]
+        self.dtype = pd.CategoricalDtype(self.order, ordered=True)
+        self.families = list(
+            dict.fromkeys(info.family for info in infos if info.family)
+        )
+        self._index = pd.Index(self.order)
+
+        # Nama yang hanya beda huruf besar (misalnya "YOLOv8n" dan "yolov8n")
+        # dicari case-insensitive ke kemunculan pertamanya
+        lower = pd.Index([name.lower() for name in self.order])
+        first = ~lower.duplicated()
+        self._lower_index = lower[first]
+        self._lower_codes = np.flatnonzero(first)
+
+    @classmethod
+    def from_names(cls, names) -> "ModelCatalog":
+        return _build_catalog(tuple(sorted(set(map(str, names)))))
+
+    def __len__(self):
+        return len(self.order)
+
+    def codes(self, models) -> np.ndarray:
+        # Nama persis dulu, lalu tanpa membedakan huruf besar, jadi "yolov8n"
+        # dari log training dan "YOLOv8n" dari tabel hasil mendapat kode sama.
+        models = pd.Series(models, copy=False).astype(str)
+        codes = self._index.get_indexer(models)
+
+        lower = self._lower_index.get_indexer(models.str.lower())
+        fallback = (codes < 0) & (lower >= 0)
+        codes[fallback] = self._lower_codes[lower[fallback]]
+
+        return codes
+
+
+@lru_cache(maxsize=32)
+def _build_catalog(names: tuple) -> ModelCatalog:
+    return ModelCatalog(names)
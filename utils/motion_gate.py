@@ -0,0 +1,102 @@
+import copy
+
+import cv2
+import numpy as np
+
+MOTION_THRESHOLD = 6.0
+
+MOTION_MAX_SKIP = 10
+
+MOTION_SIZE = (64, 48)
+
+
+class MotionGate:
+    """Tentukan apakah frame cukup berubah untuk menjalankan model lagi.
+
+    Skor perubahan adalah rata-rata selisih absolut (skala 0–255) antara
+    frame grayscale kecil saat ini dan frame terakhir yang diinferensi.
+    Model tetap dijalankan minimal setiap `max_skip` frame.
+    """
+
+    def __init__(
+        self,
+        threshold: float = MOTION_THRESHOLD,
+        max_skip: int = MOTION_MAX_SKIP,
+        size: tuple = MOTION_SIZE,
+    ):
+        self.threshold = threshold
+        self.max_skip = max_skip
+        self.size = size
+        self.reference = None
+        self.since_inference = 0
+        self.inferred = 0
+        self.skipped = 0
+
+    @property
+    def frames(self) -> int:
+        return self.inferred + self.skipped
+
+    def downscale(self, frame) -> np.ndarray:
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        small = cv2.resize(gray, self.size, interpolation=cv2.INTER_AREA)
+        return small.astype(np.float32)
+
+    def score(self, small: np.ndarray) -> float:
+        return float(np.mean(np.abs(small - self.reference)))
+
+    def should_infer(self, small: np.ndarray) -> bool:
+        if self.reference is None or self.since_inference >= self.max_skip:
+            return True
+        return self.score(small) > self.threshold
+
+    def mark_inferred(self, small: np.ndarray):
+        self.reference = small
+        self.since_inference = 0
+        self.inferred += 1
+
+    def mark_skipped(self):
+        self.since_inference += 1
+        self.skipped += 1
+
+    def shift(self, small: np.ndarray, frame_shape: tuple) -> tuple:
+        """Perkiraan pergeseran (dx, dy) frame asli sejak inferensi terakhir."""
+        (dx, dy), _ = cv2.phaseCorrelate(self.reference, small)
+        height, width = frame_shape[:2]
+        return dx * width / self.size[0], dy * height / self.size[1]
+
+
+class GatedModel:
+    """Bungkus model YOLO dengan `MotionGate`.
+
+    Antarmukanya sama dengan model (`model(frame, verbose=False)`). Frame
+    yang dilewati memakai deteksi terakhir yang digeser mengikuti gerakan
+    global frame, dan `speed`-nya kosong karena model tidak dijalankan.
+    """
+
+    def __init__(self, model, gate: MotionGate):
+        self.model = model
+        self.gate = gate
+        self._result = None
+
+    def __call__(self, frame, verbose: bool = False):
+        small = self.gate.downscale(frame)
+
+        if self._result is None or self.gate.should_infer(small):
+            results = self.model(frame, verbose=verbose)
+            self._result = results[0]
+            self.gate.mark_inferred(small)
+            return results
+
+        dx, dy = self.gate.shift(small, frame.shape)
+        self.gate.mark_skipped()
+
+        data = self._result.boxes.data
+        data = data.clone() if hasattr(data, "clone") else data.copy()
+        data[:, [0, 2]] += dx
+        data[:, [1, 3]] += dy
+
+        carried = copy.copy(self._result)
+        carried.orig_img = frame
+        carried.speed = {}
+        carried.update(boxes=data)
+        return [carried]
@@ -1,3 +0,0 @@
-def hhmmss_to_minutes(time_str):
-    h, m, s = map(int, time_str.split(":"))
-    return h * 60 + m + s / 60
@@ -1,10 +1,11 @@
 import streamlit as st
 
+from reports.bulk_export import bulk_export_sidebar
 from reports.chart_page import chart_sections
 from reports.demo_page import demo_page
 from reports.tabel_page import table_sections
-from utils.download_data import download_to_excel
-from utils.load_data import load_logo, load_main_data
+from utils.download_data import download_button
+from utils.load_data import DERIVED_COLUMNS, load_logo, load_main_data
 
 st.set_page_config(page_title="Analisis Performa YOLO", layout="wide")
 
@@ -32,30 +33,27 @@ elif dataset == "FER2013":
     dataset = "fer-2013"
     bestpt = "Unavaible"
 
+bulk_export_sidebar(dataset)
+
 overall_data, all_class_data = load_main_data(dataset)
 
 if overall_data is None or all_class_data is None:
     st.error("Gagal memuat data. Pastikan file CSV tersedia.")
     st.stop()
 
-st.subheader("Tabel Raw Data Performa Arsitektur Model")
-st.dataframe(overall_data)
+raw_data = overall_data.drop(columns=DERIVED_COLUMNS)
 
-excel_data = download_to_excel(overall_data)
+st.subheader("Tabel Raw Data Performa Arsitektur Model")
+st.dataframe(raw_data)
 
-st.download_button(
-    label="📥 Download Excel",
-    data=excel_data,
-    file_name="raw_yolo_comparison_data.xlsx",
-    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-)
+download_button(raw_data, "📥 Download", "raw_yolo_comparison_data.xlsx")
 
 
 if page == "📊 Tabel":
-    table_sections(overall_data, all_class_data, dataset)
+    table_sections(overall_data, dataset)
 
 elif page == "📈 Chart":
-    chart_sections(overall_data, all_class_data, dataset)
+    chart_sections(overall_data, dataset)
 elif page == "🧪 Demo":
     demo_page(bestpt)
 